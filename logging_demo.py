@@ -7,31 +7,50 @@ This script demonstrates various logging capabilities.
 import os
 import sys
 import time
-import json
 import logging
 import random
 from datetime import datetime
 
+import orjson
+
 # Add the current directory to path so we can import our modules
 sys.path.insert(0, f"{os.path.dirname(os.path.abspath(__file__))}/src")
 
 # Import our logging modules
 from logger import get_logger, log_exception, log_state_change, set_log_level, get_logs_stats
 
-def simulate_operation(operation_name):
+# Seed for the simulated operations, so repeated runs are comparable
+DRAW_SEED = 42
+
+# Pretty-printed logging configuration, encoded once on first use
+_STATS_JSON = None
+
+def _stats_json():
+    """Return the logging configuration as indented JSON, building it only once"""
+    global _STATS_JSON
+    if _STATS_JSON is None:
+        _STATS_JSON = orjson.dumps(get_logs_stats(), option=orjson.OPT_INDENT_2).decode()
+    return _STATS_JSON
+
+def _draws(n, seed):
+    """Precompute (sleep_seconds, failure_roll) pairs for n simulated operations"""
+    rng = random.Random(seed)
+    return [(0.1 + 0.4 * rng.random(), rng.random()) for _ in range(n)]
+
+def simulate_operation(operation_name, delay, roll):
     """Simulate an operation that might fail"""
     logger = get_logger(__name__)
-    logger.info(f"Starting operation: {operation_name}")
+    logger.info("Starting operation: %s", operation_name)
     
     try:
         # Simulate some processing time
-        time.sleep(random.uniform(0.1, 0.5))
+        time.sleep(delay)
         
         # Randomly fail some operations
-        if random.random() < 0.3:
+        if roll < 0.3:
             raise ValueError(f"Simulated failure in {operation_name}")
             
-        logger.info(f"Operation {operation_name} completed successfully")
+        logger.info("Operation %s completed successfully", operation_name)
         return True
     except Exception as e:
         log_exception(e, f"Operation {operation_name} failed")
@@ -47,8 +66,7 @@ def main():
     logger.info("=" * 60)
     
     # Show current log configuration
-    stats = get_logs_stats()
-    logger.info(f"Current logging configuration: {json.dumps(stats, indent=2)}")
+    logger.info("Current logging configuration: %s", _stats_json())
     
     # Demo different log levels
     logger.debug("This is a DEBUG message - detailed information for troubleshooting")
@@ -59,7 +77,7 @@ def main():
     
     # Change log level temporarily
     current_log_level = logging.getLogger().level
-    logger.info(f"Changing log level to DEBUG")
+    logger.info("Changing log level to DEBUG")
     set_log_level(logging.DEBUG)
     logger.debug("You should now be able to see DEBUG messages in the console")
     
@@ -84,11 +102,12 @@ def main():
         "send_notification"
     ]
     
-    for op in operations:
-        simulate_operation(op)
+    draws = _draws(len(operations), DRAW_SEED)
+    for op, (delay, roll) in zip(operations, draws):
+        simulate_operation(op, delay, roll)
     
     # Restore original log level
-    logger.info(f"Restoring original log level")
+    logger.info("Restoring original log level")
     set_log_level(current_log_level)
     
     logger.info("=" * 60)
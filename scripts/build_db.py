@@ -2,9 +2,8 @@
 # Script to create a new-style SQLite (or PostgreSQL) database
 # from your existing JSON templates (_contacts.json, _calendar.json, _tasks.json).
 
-import json
-from datetime import datetime
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, delete
 from sqlalchemy.orm import sessionmaker
 
 # Import your ORM models and Base metadata
@@ -13,21 +12,21 @@ from caltskcts.contacts import ContactData
 from caltskcts.calendars import EventData
 from caltskcts.tasks import TaskData
 from caltskcts.config import get_database_uri
+from caltskcts.date_utils import parse_date, parse_datetime
 
 DATABASE_URI = get_database_uri()
 
 # Helper to load JSON file
 def load_json(path: str) -> dict:
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
-# Parse a datetime string "MM/DD/YYYY HH:MM" into a datetime (for calendar events)
-def parse_datetime(dt_str: str) -> datetime:
-    return datetime.strptime(dt_str, "%m/%d/%Y %H:%M")
-
-# Parse a date string "MM/DD/YYYY" into a datetime (for tasks without time)
-def parse_date(dt_str: str) -> datetime:
-    return datetime.strptime(dt_str, "%m/%d/%Y")
+# Replace any existing rows with the same ids, then bulk insert them
+def bulk_replace(session, model, rows: list) -> None:
+    if not rows:
+        return
+    session.execute(delete(model).where(model.id.in_([r["id"] for r in rows])))
+    session.bulk_insert_mappings(model, rows)
 
 # Main loader
 def main():
@@ -40,40 +39,39 @@ def main():
     try:
         # 2) Load Contacts
         contacts = load_json('templates/_contacts.json')
-        for key, rec in contacts.items():
-            cid = int(key)
-            obj = ContactData(id=cid, **rec)
-            session.merge(obj)
+        contact_rows = [{"id": int(key), **rec} for key, rec in contacts.items()]
 
         # 3) Load Calendars
         calendars = load_json('templates/_calendar.json')
-        for key, rec in calendars.items():
-            bid = int(key)
-            obj = EventData(
-                id=bid,
-                title=rec['title'],
-                date=parse_datetime(rec['date']),  # parse with time
-                duration=rec['duration'],
-                users=rec['users'],
-            )
-            session.merge(obj)
+        event_rows = [
+            {
+                "id": int(key),
+                "title": rec['title'],
+                "date": parse_datetime(rec['date']),  # parse with time
+                "duration": rec['duration'],
+                "users": rec['users'],
+            }
+            for key, rec in calendars.items()
+        ]
 
         # 4) Load Tasks
         tasks = load_json('templates/_tasks.json')
+        task_rows = []
         for key, rec in tasks.items():
-            tid = int(key)
             due = rec.get('dueDate')
-            obj = TaskData(
-                id=tid,
-                title=rec.get('title'),
-                desc=rec.get('desc'),
-                dueDate=parse_date(due).date() if due else None,  # parse date only
-                progress=rec.get('progress'),
-                state=rec.get('state'),
-            )
-            session.merge(obj)
+            task_rows.append({
+                "id": int(key),
+                "title": rec.get('title'),
+                "desc": rec.get('desc'),
+                "dueDate": parse_date(due) if due else None,  # parse date only
+                "progress": rec.get('progress'),
+                "state": rec.get('state'),
+            })
 
-        # 5) Commit all
+        # 5) Write everything in one transaction
+        bulk_replace(session, ContactData, contact_rows)
+        bulk_replace(session, EventData, event_rows)
+        bulk_replace(session, TaskData, task_rows)
         session.commit()
         print("Database populated successfully.")
     except Exception:
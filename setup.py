@@ -19,13 +19,20 @@ setup(
         "pytest-asyncio==0.25.3",
         "pytest-django==4.9.0",
         "pydantic>=2.0",
-        "Flask>=2.0",
+        "Flask>=2.2",
+        "orjson>=3.6",
         "typer>=0.9.0",
         "click>=8.1.0",
         "icalendar>=4.1.0",
         "vobject>=0.9.6",
         "psycopg[binary]"
     ],
+    extras_require={
+        "server": [
+            "uvicorn[standard]",
+            "asgiref>=3.5",
+        ],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
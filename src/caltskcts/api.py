@@ -1,17 +1,86 @@
 import os
 import re
-from flask import Flask, jsonify, request, abort, send_from_directory
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import orjson
+from flask import Flask, Response, jsonify, request, abort, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy.orm import scoped_session, sessionmaker
+from werkzeug.exceptions import NotFound
 from caltskcts.contacts import Contacts
 from caltskcts.calendars import Calendar
 from caltskcts.tasks import Tasks
-from caltskcts.config import get_database_uri
+from caltskcts.state_manager import build_engine, ensure_schema
+from caltskcts.config import (
+    get_database_uri, get_static_dir, get_static_max_age, get_use_x_sendfile
+)
+
+# Rows encoded per chunk when streaming a full listing
+LIST_STREAM_BATCH = 200
+
+# Encoded single-item responses kept per resource type
+ITEM_CACHE_SIZE = 4096
+
+# Distinct error messages whose encoded bodies are memoized
+ERROR_CACHE_SIZE = 256
+
+# First standalone integer in a manager's "Task 5 added" message
+_ID_RE = re.compile(r"\b(\d+)\b")
+
+
+@lru_cache(maxsize=ERROR_CACHE_SIZE)
+def _error_body(msg: str) -> bytes:
+    """Encoded {"error": msg} body; validation messages repeat, so memoize it."""
+    return orjson.dumps({"error": msg})
+
+
+def _err(msg: str, status: int = 400) -> Response:
+    """Build a JSON error response from the memoized body."""
+    return Response(_error_body(msg), status, mimetype="application/json")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes/decodes with orjson instead of the stdlib json
+    module. Integer dict keys (as returned by list_items) are allowed, and
+    anything orjson can't handle natively falls back to Flask's `default`.
+    """
+
+    def _dumpb(self, obj: Any) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumpb(obj).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build the response straight from the encoded bytes (no str round-trip)."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumpb(obj), mimetype=self.mimetype)
+
 
 def create_app():
     # Get the directory where this file lives
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    static_dir = os.path.join(base_dir, 'static')
+    static_dir = get_static_dir() or os.path.join(base_dir, 'static')
     
-    app = Flask(__name__, static_folder=static_dir, static_url_path='')
+    # serve_static below is registered as the "static" endpoint itself, so
+    # Flask's built-in static route doesn't shadow the SPA fallback
+    app = Flask(__name__, static_folder=None)
+    app.json = OrjsonProvider(app)
+    app.json.compact = True
+    app.json.sort_keys = False
+    # static assets may be cached by the browser; behind a front-end server
+    # that honours X-Sendfile, let it stream the file instead of Python
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = get_static_max_age()
+    app.config["USE_X_SENDFILE"] = get_use_x_sendfile()
 
     # read from env or fall back to JSON files
     state_uri = get_database_uri()
@@ -23,10 +92,29 @@ def create_app():
         ctc_uri = get_contacts_uri()
         tsk_uri = get_tasks_uri()
         
+    # one pooled engine and thread-local session shared by all three managers
+    # (DB backend only)
+    engine = build_engine(state_uri) if "://" in state_uri else None
+    Session = scoped_session(sessionmaker(bind=engine, future=True)) if engine else None
+    if engine is not None:
+        ensure_schema(engine)
+
     # instantiate one manager of each type
-    contacts = Contacts(ctc_uri)
-    cal      = Calendar(cal_uri)
-    tasks    = Tasks(tsk_uri)
+    contacts = Contacts(ctc_uri, engine=engine, session_factory=Session)
+    cal      = Calendar(cal_uri, engine=engine, session_factory=Session)
+    tasks    = Tasks(tsk_uri, engine=engine, session_factory=Session)
+
+    # compile the per-request lookups now rather than on each route's first hit
+    for mgr in (contacts, cal, tasks):
+        mgr.warm_statement_cache()
+    if Session is not None:
+        Session.remove()
+
+    @app.teardown_appcontext
+    def _remove_session(exc):
+        """Hand the request thread's connection back to the pool."""
+        if Session is not None:
+            Session.remove()
 
     # ===== Helper Method ==========
     def _extract_id(msg: str) -> int:
@@ -34,24 +122,107 @@ def create_app():
         Pulls the first integer out of a string like "Task 5 added".
         Raises ValueError if none found.
         """
-        m = re.search(r"\b(\d+)\b", msg)
+        # the managers' messages are "<Kind> <id> <verb>", so try the second
+        # word before falling back to the regex
+        parts = msg.split(" ", 2)
+        if len(parts) > 1 and parts[1].isascii() and parts[1].isdigit():
+            return int(parts[1])
+        m = _ID_RE.search(msg)
         if not m:
             raise ValueError(f"Could not parse ID from message: {msg!r}")
         return int(m.group(1))
 
+    # manager -> (version, encoded listing) of its last full listing
+    _listings: Dict[Any, Tuple[int, bytes]] = {}
+
+    def _stream_listing(mgr) -> Iterator[bytes]:
+        """
+        Yield a manager's listing as one JSON object, a batch of rows per
+        chunk, so the client starts receiving bytes before encoding is done.
+        The finished body is kept as the manager's cached listing.
+        """
+        version = mgr.version
+        chunks: List[bytes] = []
+        batch: List[bytes] = []
+        for item_id, row in mgr.iter_items():
+            batch.append(orjson.dumps(str(item_id)) + b":" + orjson.dumps(row))
+            if len(batch) == LIST_STREAM_BATCH:
+                chunk = (b"," if chunks else b"{") + b",".join(batch)
+                chunks.append(chunk)
+                batch.clear()
+                yield chunk
+        if batch:
+            chunk = (b"," if chunks else b"{") + b",".join(batch)
+            chunks.append(chunk)
+            yield chunk
+        tail = b"}" if chunks else b"{}"
+        chunks.append(tail)
+        yield tail
+
+        if mgr.version == version:
+            _listings[mgr] = (version, b"".join(chunks))
+
+    def _payload() -> dict:
+        """
+        Decode the request body with orjson, skipping Flask's content-type
+        checks and str round-trip. An empty body is treated as {}.
+        """
+        data = request.get_data(cache=False)
+        if not data:
+            return {}
+        try:
+            payload = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            abort(400, description=f"Invalid JSON body: {e}")
+        if not isinstance(payload, dict):
+            abort(400, description="JSON body must be an object")
+        return payload
+
+    def _item_cache(getter: Callable[[int], Optional[dict]]) -> Callable[[int, int], Optional[bytes]]:
+        """
+        Wrap a manager's get_* method in an LRU of encoded responses keyed by
+        (item_id, manager version). A write bumps the version, so stale entries
+        are never hit again and simply age out. Missing items cache as None.
+        """
+        @lru_cache(maxsize=ITEM_CACHE_SIZE)
+        def cached(item_id: int, version: int) -> Optional[bytes]:
+            obj = getter(item_id)
+            return orjson.dumps(obj) if obj else None
+        return cached
+
+    def _list_response(mgr) -> Response:
+        """
+        Return the full listing for a manager: the cached bytes when the
+        manager's data version hasn't moved, otherwise a streamed re-encode.
+        With ?compact=1 the columnar list_items_compact() layout is sent instead.
+        """
+        if request.args.get("compact") == "1":
+            return Response(orjson.dumps(mgr.list_items_compact()), 200, mimetype="application/json")
+        cached = _listings.get(mgr)
+        if cached is not None and cached[0] == mgr.version:
+            return Response(cached[1], 200, mimetype="application/json")
+        return Response(_stream_listing(mgr), 200, mimetype="application/json")
+
+    _cached_contact = _item_cache(contacts.get_contact)
+    _cached_event   = _item_cache(cal.get_event)
+    _cached_task    = _item_cache(tasks.get_task)
+
     # ===== FRONTEND ROUTES =====
 
     @app.route("/")
     def serve_frontend():
         """Serve the main frontend application"""
-        return send_from_directory(static_dir, 'index.html')
+        return send_from_directory(static_dir, 'index.html', max_age=0)
 
-    @app.route("/<path:path>")
-    def serve_static(path):
+    @app.route("/<path:filename>", endpoint="static")
+    def serve_static(filename):
         """Serve static files, fallback to index.html for SPA routing"""
-        if os.path.exists(os.path.join(static_dir, path)):
-            return send_from_directory(static_dir, path)
-        return send_from_directory(static_dir, 'index.html')
+        try:
+            # the SPA shell must always revalidate, however it's requested
+            max_age = 0 if filename == 'index.html' else None
+            return send_from_directory(static_dir, filename, max_age=max_age)
+        except NotFound:
+            return send_from_directory(static_dir, 'index.html', max_age=0)
 
     # ===== CONTACTS ENDPOINTS =====
 
@@ -61,42 +232,38 @@ def create_app():
         search_query = request.args.get('q')
         if search_query:
             return jsonify(contacts.search_contacts(search_query))
-        return jsonify(contacts.list_contacts()), 200
+        return _list_response(contacts)
 
     @app.route("/contacts/<int:cid>", methods=["GET"])
     def get_contact(cid):
         """Get a specific contact by ID"""
-        c = contacts.get_contact(cid)
-        if not c:
+        buf = _cached_contact(cid, contacts.version)
+        if buf is None:
             abort(404, description=f"Contact with ID {cid} not found")
-        return jsonify(c), 200
+        return Response(buf, 200, mimetype="application/json")
 
     @app.route("/contacts", methods=["POST"])
     def add_contact():
         """Add a new contact"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = contacts.add_contact(**payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return _err(str(e))
         try:
             cid = _extract_id(msg)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e), 500)
         return jsonify({"id": cid, "message": msg}), 201
 
     @app.route("/contacts/<int:cid>", methods=["PUT"])
     def update_contact(cid):
         """Update an existing contact"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = contacts.update_contact(cid, **payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        try:
-            cid = _extract_id(msg)
-        except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e))
         return jsonify({"id": cid, "message": msg}), 200
 
     @app.route("/contacts/<int:cid>", methods=["DELETE"])
@@ -105,11 +272,7 @@ def create_app():
         try:
             msg = contacts.delete_contact(cid)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        try:
-            cid = _extract_id(msg)
-        except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e))
         return jsonify({"id": cid, "message": msg}), 200
 
     # ===== CALENDAR ENDPOINTS =====
@@ -119,50 +282,47 @@ def create_app():
         """Get all events or events by date range (e.g., ?start=10/01/2023 09:00&end=10/31/2023 23:59)
            Get all events by date (e.g., ?date=10/01/2023)
         """
-        start_date = request.args.get('start')
-        end_date = request.args.get('end')
-        date = request.args.get('date')
+        args = request.args
+        start_date = args.get('start')
+        end_date = args.get('end')
+        date = args.get('date')
         
         if start_date and end_date:
             return jsonify(cal.get_events_between(start_date, end_date))
         elif date:
             return jsonify(cal.get_events_by_date(date))
-        return jsonify(cal.list_items()), 200
+        return _list_response(cal)
 
     @app.route("/events/<int:eid>", methods=["GET"])
     def get_event(eid):
         """Get a specific event by ID"""
-        event = cal.get_event(eid)
-        if not event:
+        buf = _cached_event(eid, cal.version)
+        if buf is None:
             abort(404, description=f"Event with ID {eid} not found")
-        return jsonify(event), 200
+        return Response(buf, 200, mimetype="application/json")
 
     @app.route("/events", methods=["POST"])
     def add_event():
         """Add a new event"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = cal.add_event(**payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return _err(str(e))
         try:
             eid = _extract_id(msg)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e), 500)
         return jsonify({"id": eid, "message": msg}), 201
 
     @app.route("/events/<int:eid>", methods=["PUT"])
     def update_event(eid):
         """Update an existing event"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = cal.update_event(eid, **payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        try:
-            eid = _extract_id(msg)
-        except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e))
         return jsonify({"id": eid, "message": msg}), 200
 
     @app.route("/events/<int:eid>", methods=["DELETE"])
@@ -171,14 +331,15 @@ def create_app():
         try:
             msg = cal.delete_event(eid)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return _err(str(e))
         return jsonify({"message": msg}), 200
 
     @app.route('/events/next-available', methods=['GET'])
     def find_next_available():
         """Find next available time slot"""
-        start_datetime = request.args.get('start')
-        duration = request.args.get('duration')
+        args = request.args
+        start_datetime = args.get('start')
+        duration = args.get('duration')
         try:
             duration = int(duration)
             result = cal.find_next_available(start_datetime, duration)
@@ -191,11 +352,12 @@ def create_app():
     @app.route("/tasks", methods=["GET"])
     def get_tasks():
         """Get all tasks or filter by various criteria"""
-        due_date = request.args.get('due_date')
-        due_on_or_before = request.args.get('due_on_or_before')
-        state = request.args.get('state')
-        min_progress = request.args.get('min_progress')
-        max_progress = request.args.get('max_progress')
+        args = request.args
+        due_date = args.get('due_date')
+        due_on_or_before = args.get('due_on_or_before')
+        state = args.get('state')
+        min_progress = args.get('min_progress')
+        max_progress = args.get('max_progress')
         
         if due_date == 'today':
             return jsonify(tasks.get_tasks_due_today())
@@ -209,43 +371,39 @@ def create_app():
             min_p = float(min_progress) if min_progress else 0.0
             max_p = float(max_progress) if max_progress else 100.0
             return jsonify(tasks.get_tasks_with_progress(min_p, max_p))
-        return jsonify(tasks.list_tasks())
+        return _list_response(tasks)
 
     @app.route("/tasks/<int:tid>", methods=["GET"])
     def get_task(tid):
         """Get a specific task by ID"""
-        t = tasks.get_task(tid)
-        if not t:
+        buf = _cached_task(tid, tasks.version)
+        if buf is None:
             abort(404, description=f"Task with ID {tid} not found")
-        return jsonify(t), 200
+        return Response(buf, 200, mimetype="application/json")
 
     @app.route("/tasks", methods=["POST"])
     def add_task():
         """Add a new task"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = tasks.add_task(**payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return _err(str(e))
         try:
             tid = _extract_id(msg)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 500
+            return _err(str(e), 500)
         return jsonify({"id": tid}), 201
 
     @app.route("/tasks/<int:tid>", methods=["PUT"])
     def update_task(tid):
         """Update an existing task"""
-        payload = request.get_json() or {}
+        payload = _payload()
         try:
             msg = tasks.update_task(tid, **payload)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        try:
-            id = _extract_id(msg)
-        except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        return jsonify({"id": id, "message": msg}), 200
+            return _err(str(e))
+        return jsonify({"id": tid, "message": msg}), 200
 
     @app.route("/tasks/<int:tid>", methods=["DELETE"])
     def delete_task(tid):
@@ -253,15 +411,34 @@ def create_app():
         try:
             msg = tasks.delete_task(tid)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        try:
-            id = _extract_id(msg)
-        except ValueError as e:
-            return jsonify({"error": str(e)}), 400
-        return jsonify({"id": id, "message": msg}), 200
+            return _err(str(e))
+        return jsonify({"id": tid, "message": msg}), 200
 
     return app
 
 
+def create_asgi_app():
+    """ASGI wrapper around create_app(), for serving under uvicorn."""
+    from asgiref.wsgi import WsgiToAsgi
+    return WsgiToAsgi(create_app())
+
+
 if __name__ == "__main__":
-    create_app().run(debug=True)
+    try:
+        import uvicorn
+    except ImportError:
+        # server extras not installed: fall back to Werkzeug (no reloader/debugger)
+        create_app().run()
+    else:
+        # A single worker: each process keeps its own in-memory state, ID
+        # counter and response caches, loaded once at startup, so a second
+        # worker would serve stale reads and hand out colliding IDs.
+        # loop="auto" picks uvloop when it is installed
+        uvicorn.run(
+            "caltskcts.api:create_asgi_app",
+            factory=True,
+            host="127.0.0.1",
+            port=5000,
+            workers=1,
+            loop="auto",
+        )
@@ -1,11 +1,21 @@
-from typing import Dict, List, Optional, Any, MutableMapping, Tuple
+import sys
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Any, MutableMapping, Set, Tuple
 from datetime import datetime, timedelta
+from itertools import islice
+from functools import lru_cache
 from sqlalchemy import Integer, String, DateTime, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import ValidationError
+from caltskcts.date_utils import parse_datetime
 from caltskcts.state_manager import Base, StateManagerBase
 from caltskcts.schemas import EventModel
 
+@lru_cache(maxsize=4096)
+def _parse_when(value: str) -> datetime:
+    """Parse an "MM/DD/YYYY HH:MM" event time; repeated strings hit the cache."""
+    return parse_datetime(value)
+
 class EventData(Base):
     __tablename__ = "calendars"
     
@@ -19,6 +29,11 @@ class Calendar(StateManagerBase[EventData]):
     """Manages calendar events and scheduling."""
     
     Model = EventData
+    _slots: Dict[int, Tuple[datetime, datetime]]  # event ID -> parsed (start, end)
+    _by_date: Dict[str, Set[int]]                 # "MM/DD/YYYY" -> IDs of events that day
+    _day_of: Dict[int, str]                       # event ID -> its _by_date key
+    _sorted_slots: List[Tuple[datetime, datetime, int]]  # (start, end, ID), ordered by start
+    _longest: timedelta                           # upper bound on any indexed event's length
 
     def _validate_item(self, item: MutableMapping[str, Any]) -> bool:
         """
@@ -41,6 +56,58 @@ class Calendar(StateManagerBase[EventData]):
         self.logger.debug("Item validated")
         return True
 
+    def _reindex(self) -> None:
+        slots: Dict[int, Tuple[datetime, datetime]] = {}
+        by_date: Dict[str, Set[int]] = {}
+        day_of: Dict[int, str] = {}
+        sorted_slots: List[Tuple[datetime, datetime, int]] = []
+        longest = timedelta(0)
+        for event_id, event in list(self._state.items()):
+            start, end, day = self._event_slot(event)
+            slots[event_id] = (start, end)
+            sorted_slots.append((start, end, event_id))
+            longest = max(longest, end - start)
+            by_date.setdefault(day, set()).add(event_id)
+            day_of[event_id] = day
+        # one sort for a full rebuild; insort is for single-item patches
+        sorted_slots.sort()
+        self._slots, self._by_date, self._day_of = slots, by_date, day_of
+        self._sorted_slots, self._longest = sorted_slots, longest
+
+    def _event_slot(self, event: Any) -> Tuple[datetime, datetime, str]:
+        """An event's parsed start and end, and its "MM/DD/YYYY" day key."""
+        if self._use_db:
+            start, duration = event.date, event.duration
+            day = start.strftime("%m/%d/%Y")
+        else:
+            start, duration = _parse_when(event["date"]), event["duration"]
+            day = event["date"][:10]
+        # a missing duration (allowed by EventModel, and what ICS imports
+        # without DURATION/DTEND produce) occupies no time
+        end = start + timedelta(minutes=duration or 0)
+        # one shared string per day for the bucket key and every _day_of entry
+        return start, end, sys.intern(day)
+
+    def _index_item(self, item_id: int) -> None:
+        start, end, day = self._event_slot(self._state[item_id])
+        self._slots[item_id] = (start, end)
+        insort(self._sorted_slots, (start, end, item_id))
+        self._longest = max(self._longest, end - start)
+        self._by_date.setdefault(day, set()).add(item_id)
+        self._day_of[item_id] = day
+
+    def _unindex_item(self, item_id: int) -> None:
+        slot = self._slots.pop(item_id, None)
+        if slot is not None:
+            i = bisect_left(self._sorted_slots, (*slot, item_id))
+            del self._sorted_slots[i]
+        day = self._day_of.pop(item_id, None)
+        if day is not None:
+            bucket = self._by_date[day]
+            bucket.discard(item_id)
+            if not bucket:
+                del self._by_date[day]
+
     def add_event(
         self,
         title: str = "",
@@ -152,11 +219,18 @@ class Calendar(StateManagerBase[EventData]):
         Returns:
             List of events on that date
         """
-        results: List[Dict[str, Any]] = []
-        for event_id, event in self.items.items():
-            if event["date"].startswith(date):
-                results.append({"event_id": int(event_id), **event})
-        return results
+        self._sync_index()
+        if len(date) == 10:
+            # a full MM/DD/YYYY: read the day's bucket directly
+            event_ids = sorted(self._by_date.get(date, ()))
+        else:
+            # any other prefix: match it against each event's date string
+            event_ids = sorted(
+                eid for eid, day in list(self._day_of.items()) if day.startswith(date[:10])
+            )
+            if len(date) > 10:
+                event_ids = [eid for eid in event_ids if self._row(eid)["date"].startswith(date)]
+        return [{"event_id": int(eid), **self._row(eid)} for eid in event_ids]
     
     def get_events_between(self, start_datetime: str, end_datetime: str) -> List[Dict[str, Any]]:
         """
@@ -175,16 +249,15 @@ class Calendar(StateManagerBase[EventData]):
         if len(end_datetime.split()) == 1:
             end_datetime += " 23:59"
             
-        start = datetime.strptime(start_datetime, "%m/%d/%Y %H:%M")
-        end = datetime.strptime(end_datetime, "%m/%d/%Y %H:%M")
-        
-        results: List[Dict[str, Any]] = []
-        for event_id, event in self.items.items():
-            event_time = datetime.strptime(event["date"], "%m/%d/%Y %H:%M")
-            if start <= event_time <= end:
-                results.append({"event_id": int(event_id), **event})
+        start = parse_datetime(start_datetime)
+        end = parse_datetime(end_datetime)
         
-        return results
+        self._sync_index()
+        lo = bisect_left(self._sorted_slots, (start,))
+        hi = bisect_right(self._sorted_slots, (end, datetime.max))
+        # ID order, like get_events_by_date
+        event_ids = sorted(event_id for _, _, event_id in self._sorted_slots[lo:hi])
+        return [{"event_id": int(event_id), **self._row(event_id)} for event_id in event_ids]
     
     def find_next_available(self, start_datetime: str, duration_minutes: int = 30) -> str:
         """
@@ -197,30 +270,26 @@ class Calendar(StateManagerBase[EventData]):
         Returns:
             Available time slot (MM/DD/YYYY HH:MM)
         """
-        start = datetime.strptime(start_datetime, "%m/%d/%Y %H:%M")
+        start = parse_datetime(start_datetime)
         
-        # Get all booked times sorted by start time
-        booked_slots: List[Tuple[datetime, datetime]] = []
-        for event in self.items.values():
-            event_start = datetime.strptime(event["date"], "%m/%d/%Y %H:%M")
-            event_end = event_start + timedelta(minutes=event["duration"])
-            booked_slots.append((event_start, event_end))
-            
-        booked_slots.sort()  # Sort by start time
+        # Booked times are kept sorted by start; anything starting more than
+        # the longest event's length before `start` has ended by then, so the
+        # sweep can begin from there.
+        self._sync_index()
+        first = bisect_left(self._sorted_slots, (start - self._longest,))
         
-        while True:
-            conflict_found = False
-            proposed_end = start + timedelta(minutes=duration_minutes)
-            
-            for event_start, event_end in booked_slots:
-                if start < event_end and proposed_end > event_start:
-                    # Conflict found, move start to end of this event
-                    start = event_end
-                    conflict_found = True
-                    break
-                
-            if not conflict_found:
-                return start.strftime("%m/%d/%Y %H:%M")
+        # Single sweep in start order: a conflicting event pushes the
+        # proposed slot to its end, and once an event starts at or after the
+        # proposed end, no later one can conflict either.
+        needed = timedelta(minutes=duration_minutes)
+        proposed_end = start + needed
+        for event_start, event_end, _ in islice(self._sorted_slots, first, None):
+            if event_start >= proposed_end:
+                break
+            if event_end > start:
+                start = event_end
+                proposed_end = start + needed
+        return start.strftime("%m/%d/%Y %H:%M")
 
     def list_events(self) -> Dict[int, Any]:
         """
@@ -1,15 +1,9 @@
 # cli.py - Typer-based CLI for CalTskCts
-import json
-from typing import Any, Optional, List
+import orjson
+from typing import Any, Callable, Optional, List
 import typer
 from pathlib import Path
 from caltskcts.dispatch_utils import dispatch_command
-from caltskcts.import_export import (
-    export_contacts_csv, import_contacts_csv, 
-    import_contacts_vcard, export_contacts_vcard,
-    export_events_ics,  import_events_ics,
-    export_tasks_csv,  import_tasks_csv
-)
 from caltskcts.calendars import Calendar
 from caltskcts.contacts  import Contacts
 from caltskcts.tasks     import Tasks
@@ -20,6 +14,31 @@ from caltskcts.config    import (
     get_tasks_uri
 )
 
+# Match the old json.dumps(indent=2, default=str) output: int keys become
+# strings and datetimes go through str() rather than orjson's ISO format
+RAW_JSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+class _LazyManager:
+    """
+    Stands in for a Calendar/Tasks/Contacts in ctx.obj and only constructs it
+    (loading its file or opening its database) on first attribute access, so a
+    command pays for the one manager it uses. state_uri is answered directly,
+    which is all import/export need.
+    """
+    __slots__ = ("_factory", "state_uri", "_mgr")
+
+    def __init__(self, factory: Callable[[str], Any], state_uri: str) -> None:
+        self._factory = factory
+        self.state_uri = state_uri
+        self._mgr = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._mgr is None:
+            self._mgr = self._factory(self.state_uri)
+        return getattr(self._mgr, name)
+
 app = typer.Typer(
     help="Calendar, Tasks, and Contacts Manager", 
     context_settings={"obj": {}},
@@ -67,10 +86,9 @@ def main(
         tsk_uri = get_tasks_uri()
         typer.echo(f"🔣 Using JSON backend.")
 
-    ctx.obj["cal"] = Calendar(cal_uri)
-    ctx.obj["tsk"] = Tasks(tsk_uri)
-    ctx.obj["ctc"] = Contacts(ctc_uri)
-    ctx.obj["result"] = {}
+    ctx.obj["cal"] = _LazyManager(Calendar, cal_uri)
+    ctx.obj["tsk"] = _LazyManager(Tasks, tsk_uri)
+    ctx.obj["ctc"] = _LazyManager(Contacts, ctc_uri)
 
 # Sub-applications for grouping commands
 cal_app = typer.Typer(help="Commands for calendar events")
@@ -407,7 +425,7 @@ def raw(
     """Execute raw REPL-style command (e.g. cal.list_events())"""
     try:
         result = dispatch_command(command, ctx.obj)
-        typer.echo(json.dumps(result, indent=2, default=str))
+        typer.echo(orjson.dumps(result, default=str, option=RAW_JSON_OPTIONS))
     except Exception as e:
         typer.echo(f"Error: {e}")
 
@@ -421,6 +439,10 @@ def export(
     """
     Export contacts/events/tasks into the given format.
     """
+    # imported here so other commands don't pay for loading icalendar/vobject
+    from caltskcts.import_export import (
+        export_contacts_csv, export_contacts_vcard, export_events_ics, export_tasks_csv
+    )
     if what == "contacts" and fmt == "csv":
         export_contacts_csv(ctx.obj["ctc"].state_uri, out)
     elif what == "contacts" and fmt == "vcard":
@@ -442,6 +464,10 @@ def import_(
     """
     Import from CSV/ICS into your state.
     """
+    # imported here so other commands don't pay for loading icalendar/vobject
+    from caltskcts.import_export import (
+        import_contacts_csv, import_contacts_vcard, import_events_ics, import_tasks_csv
+    )
     if what == "contacts":
         if in_.suffix.lower() == ".vcf":
             ids = import_contacts_vcard(ctx.obj["ctc"].state_uri, in_)
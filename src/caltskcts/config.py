@@ -11,3 +11,12 @@ def get_contacts_uri():
 
 def get_tasks_uri():
     return os.getenv("CALTSKCTS_TASKS_FILE", "_tasks.json")
+
+def get_static_dir():
+    return os.getenv("CALTSKCTS_STATIC_DIR")
+
+def get_static_max_age():
+    return int(os.getenv("CALTSKCTS_STATIC_MAX_AGE", "86400"))
+
+def get_use_x_sendfile():
+    return os.getenv("CALTSKCTS_X_SENDFILE", "0") == "1"
@@ -1,3 +1,4 @@
+import re
 from typing import Dict, List, Optional, Any, MutableMapping
 from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
@@ -5,6 +6,16 @@ from pydantic import ValidationError
 from caltskcts.state_manager import Base, StateManagerBase
 from caltskcts.schemas import ContactModel
 
+# Fields matched by search_contacts()
+SEARCH_FIELDS = (
+    "first_name", "last_name", "email", "company",
+    "work_phone", "mobile_phone", "home_phone",
+)
+
+# Regex constructs that can match a single field but not the same text inside
+# the newline-joined field text (absolute anchors, lookarounds, inline flags)
+_NO_PREFILTER = ("(?", "\\A", "\\Z")
+
 
 class ContactData(Base):
     __tablename__ = "contacts"
@@ -24,6 +35,8 @@ class Contacts(StateManagerBase[ContactData]):
     """Manages lists of contacts and their information such as email, phone numbers, etc."""
 
     Model = ContactData
+    _search_text: Dict[int, str]  # contact ID -> non-empty SEARCH_FIELDS, one per line
+    _search_blob: Dict[int, str]  # the same text, lowercased
 
     def _validate_item(self, item: MutableMapping[str, Any]) -> bool:
         """
@@ -44,6 +57,32 @@ class Contacts(StateManagerBase[ContactData]):
             raise ValueError(str(ve))
         return True
 
+    def _reindex(self) -> None:
+        search_text: Dict[int, str] = {}
+        search_blob: Dict[int, str] = {}
+        for contact_id, contact in list(self._state.items()):
+            text = self._contact_text(contact)
+            search_text[contact_id] = text
+            search_blob[contact_id] = text.lower()
+        self._search_text, self._search_blob = search_text, search_blob
+
+    def _contact_text(self, contact: Any) -> str:
+        """A contact's non-empty SEARCH_FIELDS values, one per line."""
+        if self._use_db:
+            values = [getattr(contact, f) for f in SEARCH_FIELDS]
+        else:
+            values = [contact.get(f) for f in SEARCH_FIELDS]
+        return "\n".join(str(v) for v in values if v)
+
+    def _index_item(self, item_id: int) -> None:
+        text = self._contact_text(self._state[item_id])
+        self._search_text[item_id] = text
+        self._search_blob[item_id] = text.lower()
+
+    def _unindex_item(self, item_id: int) -> None:
+        self._search_text.pop(item_id, None)
+        self._search_blob.pop(item_id, None)
+
     def add_contact(
         self,
         first_name: str = "",
@@ -179,11 +218,43 @@ class Contacts(StateManagerBase[ContactData]):
         Returns:
             List of matching contacts with their IDs included
         """
-        search_fields = [
-            "first_name", "last_name", "email", "company",
-            "work_phone", "mobile_phone", "home_phone"
+        if "\n" in query or not self._is_literal_query(query):
+            return self._search_regex(query)
+
+        # literal query: a case-insensitive substring test on each contact's
+        # prebuilt field text gives the same matches as the regex would
+        self._sync_index()
+        needle = query.lower()
+        matched = [
+            contact_id
+            for contact_id, blob in list(self._search_blob.items())
+            if blob and needle in blob
         ]
-        return self.search_items(query, search_fields)
+        # ID order: a patched contact moves to the end of _search_blob
+        return [self._search_row(contact_id) for contact_id in sorted(matched)]
+
+    def _search_regex(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Regex search over SEARCH_FIELDS. One multiline search of each contact's
+        joined field text rules out non-matching contacts; only those that hit
+        are checked field by field, so results match search_items() exactly.
+        """
+        fields = list(SEARCH_FIELDS)
+        if any(token in query for token in _NO_PREFILTER):
+            return self.search_items(query, fields)
+        per_field = self._compile_query(query)
+        joined = self._compile_query(query, re.IGNORECASE | re.MULTILINE)
+
+        self._sync_index()
+        results: List[Dict[str, Any]] = []
+        # sorted() snapshots the index and keeps results in ID order
+        for contact_id, text in sorted(self._search_text.items()):
+            if not joined.search(text):
+                continue
+            row = self._search_row(contact_id)
+            if any(row.get(f) and per_field.search(str(row[f])) for f in fields):
+                results.append(row)
+        return results
 
     def list_contacts(self) -> Dict[int, Any]:
         """
@@ -0,0 +1,58 @@
+"""
+Parsing helpers for the "MM/DD/YYYY[ HH:MM]" formats used by the state files,
+the API and the CLI.
+"""
+
+from datetime import date, datetime
+
+DATETIME_FORMAT = "%m/%d/%Y %H:%M"
+DATE_FORMAT = "%m/%d/%Y"
+
+
+def _digits(*parts: str) -> bool:
+    return all(p.isascii() and p.isdigit() for p in parts)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse an "MM/DD/YYYY HH:MM" string.
+
+    The zero-padded layout is sliced directly, which is much cheaper than
+    strptime; anything else falls back to strptime, so the accepted inputs
+    and errors are the same as before.
+
+    Args:
+        value: Date and time string
+
+    Returns:
+        The parsed datetime
+
+    Raises:
+        ValueError: If the string doesn't match the format
+    """
+    if (len(value) == 16 and value[2] == "/" and value[5] == "/"
+            and value[10] == " " and value[13] == ":"):
+        mm, dd, yyyy, hh, mi = value[0:2], value[3:5], value[6:10], value[11:13], value[14:16]
+        if _digits(mm, dd, yyyy, hh, mi):
+            return datetime(int(yyyy), int(mm), int(dd), int(hh), int(mi))
+    return datetime.strptime(value, DATETIME_FORMAT)
+
+
+def parse_date(value: str) -> date:
+    """
+    Parse an "MM/DD/YYYY" string, with the same fast path as parse_datetime.
+
+    Args:
+        value: Date string
+
+    Returns:
+        The parsed date
+
+    Raises:
+        ValueError: If the string doesn't match the format
+    """
+    if len(value) == 10 and value[2] == "/" and value[5] == "/":
+        mm, dd, yyyy = value[0:2], value[3:5], value[6:10]
+        if _digits(mm, dd, yyyy):
+            return date(int(yyyy), int(mm), int(dd))
+    return datetime.strptime(value, DATE_FORMAT).date()
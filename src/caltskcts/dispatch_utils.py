@@ -1,45 +1,78 @@
-from typing import Dict, Any
+import ast
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 from caltskcts.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed commands kept by _parse_command()
+COMMAND_CACHE_SIZE = 256
+
+# Marks an attribute lookup that found nothing
+_MISSING = object()
+
+@lru_cache(maxsize=COMMAND_CACHE_SIZE)
+def _parse_command(command: str) -> Tuple[str, str, Tuple[ast.expr, ...], Tuple[Tuple[str, ast.expr], ...]]:
+    """
+    Parse `obj.method(args...)` into (obj name, method name, positional arg
+    nodes, keyword arg nodes). The AST nodes are cached rather than their
+    values so each call still gets fresh copies of list/dict arguments.
+    """
+    try:
+        tree = ast.parse(command.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid command format: {e.msg}")
+    call = tree.body
+    if not (isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name)):
+        raise ValueError("Invalid command format")
+    keywords: List[Tuple[str, ast.expr]] = []
+    for kw in call.keywords:
+        if kw.arg is None:
+            raise ValueError("Invalid command format: ** arguments are not supported")
+        keywords.append((kw.arg, kw.value))
+    return call.func.value.id, call.func.attr, tuple(call.args), tuple(keywords)
+
 def dispatch_command(command: str, context: Dict[str, Any]) -> Any:
     """Safely execute a command in the given context"""
     logger.debug(f"Dispatching command: {command}")
-    allowed_prefixes = [f"{key}." for key in context.keys()]
-    if not any(command.startswith(prefix) for prefix in allowed_prefixes):
+    obj_prefix, dot, _ = command.partition(".")
+    if not dot or obj_prefix not in context:
         error_msg = f"Invalid command. Must use one of: {', '.join(context.keys())}"
         logger.warning(f"Command validation failed: {error_msg}")
         raise ValueError(error_msg)
-    parts = command.split(".", 1)
-    if len(parts) != 2:
-        error_msg = "Invalid command format"
-        logger.warning(f"Command parsing failed: {error_msg}")
-        raise ValueError(error_msg)
-    obj_name, method_call = parts
+    try:
+        obj_name, method_name, arg_nodes, kwarg_nodes = _parse_command(command)
+    except ValueError as e:
+        logger.warning(f"Command parsing failed: {e}")
+        raise
     obj = context.get(obj_name)
     if not obj:
         error_msg = f"Unknown object: {obj_name}"
         logger.warning(f"Command validation failed: {error_msg}")
         raise ValueError(error_msg)
-    method_name = method_call.split("(", 1)[0].strip()
-    if not hasattr(obj, method_name):
+    method = _MISSING if method_name.startswith("_") else getattr(obj, method_name, _MISSING)
+    if method is _MISSING:
         error_msg = f"Unknown method: {method_name}"
         logger.warning(f"Command validation failed: {error_msg}")
         raise ValueError(error_msg)
-    method = getattr(obj, method_name)
     if not callable(method):
         error_msg = f"{method_name} is not callable"
         logger.warning(f"Command validation failed: {error_msg}")
         raise ValueError(error_msg)
-    local_context = {**context}
-    exec_str = f"result[0] = {command}"
+    try:
+        args = [ast.literal_eval(node) for node in arg_nodes]
+        kwargs = {name: ast.literal_eval(node) for name, node in kwarg_nodes}
+    except ValueError:
+        error_msg = "Invalid command format: arguments must be literals"
+        logger.warning(f"Command parsing failed: {error_msg}")
+        raise ValueError(error_msg)
     try:
         logger.info(f"Executing command: {command}")
-        exec(exec_str, {"__builtins__": {}}, local_context)
+        result = method(*args, **kwargs)
         logger.debug("Command executed successfully")
-        return local_context["result"][0]
+        return result
     except Exception as e:
         logger.error(f"Command execution failed: {str(e)}")
         raise
-
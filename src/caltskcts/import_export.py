@@ -8,10 +8,17 @@ from caltskcts.contacts import Contacts
 from caltskcts.calendars import Calendar
 from caltskcts.tasks import Tasks
 from caltskcts.schemas import ContactModel, EventModel, TaskModel
+from caltskcts.date_utils import parse_datetime
 
 from icalendar import Calendar as ICalendar, Event as ICSEvent
 import vobject
 
+# First standalone integer in a manager's "... 42 added" message
+_ID_RE = re.compile(r"\b(\d+)\b")
+
+# UID written by export_events_ics, carrying the original event ID
+_EXPORTED_UID_RE = re.compile(r"^event-(\d+)@")
+
 # --------------------
 #   Helper functions
 # --------------------
@@ -20,7 +27,7 @@ def _extract_id(msg: str) -> int:
     Pulls the first integer out of a string like "Contact 42 added".
     Raises ValueError if none found.
     """
-    m = re.search(r"\b(\d+)\b", msg)
+    m = _ID_RE.search(msg)
     if not m:
         raise ValueError(f"Could not parse ID from message: {msg!r}")
     return int(m.group(1))
@@ -85,7 +92,7 @@ def import_contacts_csv(state_uri: str, in_path: Path) -> List[int]:
     mgr = Contacts(state_uri)
     new_ids: List[int] = []
 
-    with in_path.open("r", newline="", encoding="utf-8") as f:
+    with in_path.open("r", newline="", encoding="utf-8") as f, mgr.batch():
         reader = csv.DictReader(f)
         fld = reader.fieldnames or []
         if not fld or fld[0] != "id":
@@ -190,7 +197,7 @@ def import_contacts_vcard(state_uri: str, in_path: Path) -> List[int]:
     mgr = Contacts(state_uri)
     imported_ids: List[int] = []
 
-    with in_path.open("r", encoding="utf-8") as f:
+    with in_path.open("r", encoding="utf-8") as f, mgr.batch():
         for card in vobject.readComponents(f):
             data: dict[str, str] = {}
 
@@ -265,7 +272,7 @@ def export_events_ics(state_uri: str, out_path: Path) -> None:
         dt = data["date"]
         if dt is not None:
             if isinstance(dt, str):
-                dt = datetime.strptime(dt, "%m/%d/%Y %H:%M")
+                dt = parse_datetime(dt)
             ie.add("dtstart", dt)
         dur = data["duration"]
         if dur is not None:
@@ -304,43 +311,44 @@ def import_events_ics(state_uri: str, in_path: Path) -> List[int]:
     except ValueError:
         return []
 
-    for comp in ics.walk():
-        if comp.name != "VEVENT":
-            continue
-
-        uid = str(comp.get("uid", ""))
-        m = re.match(r"^event-(\d+)@", uid)
-        if not m:
-            event_id = None # Fall back to get new if not our previous export
-        else:
-            event_id = int(m.group(1))
-
-        title    = str(comp.get("summary", ""))
-        dtstart  = comp.decoded("dtstart")
-        date_str = dtstart.strftime("%m/%d/%Y %H:%M")
-
-        # If no "duration" but "dtend" then try to compute
-        try:
-            dur_td = comp.decoded("duration")
-        except KeyError:
-            dtend = comp.decoded("dtend")
-            dur_td = (dtend - dtstart) if dtend else None
-        minutes = int(dur_td.total_seconds() // 60) if dur_td else None
-
-        att = comp.get("attendee", [])
-        if isinstance(att, list):
-            users = [str(a) for a in att]
-        else:
-            users = [str(att)]
-
-        msg = mgr.add_event(
-            title=title,
-            date=date_str,
-            duration=minutes,
-            users=users,
-            event_id=event_id,
-        )
-        imported.append(_extract_id(msg))
+    with mgr.batch():
+        for comp in ics.walk():
+            if comp.name != "VEVENT":
+                continue
+
+            uid = str(comp.get("uid", ""))
+            m = _EXPORTED_UID_RE.match(uid)
+            if not m:
+                event_id = None # Fall back to get new if not our previous export
+            else:
+                event_id = int(m.group(1))
+
+            title    = str(comp.get("summary", ""))
+            dtstart  = comp.decoded("dtstart")
+            date_str = dtstart.strftime("%m/%d/%Y %H:%M")
+
+            # If no "duration" but "dtend" then try to compute
+            try:
+                dur_td = comp.decoded("duration")
+            except KeyError:
+                dtend = comp.decoded("dtend")
+                dur_td = (dtend - dtstart) if dtend else None
+            minutes = int(dur_td.total_seconds() // 60) if dur_td else None
+
+            att = comp.get("attendee", [])
+            if isinstance(att, list):
+                users = [str(a) for a in att]
+            else:
+                users = [str(att)]
+
+            msg = mgr.add_event(
+                title=title,
+                date=date_str,
+                duration=minutes,
+                users=users,
+                event_id=event_id,
+            )
+            imported.append(_extract_id(msg))
 
     return imported
 
@@ -392,7 +400,7 @@ def import_tasks_csv(state_uri: str, in_path: Path) -> List[int]:
     mgr = Tasks(state_uri)
     new_ids: List[int] = []
 
-    with in_path.open("r", newline="", encoding="utf-8") as f:
+    with in_path.open("r", newline="", encoding="utf-8") as f, mgr.batch():
         reader = csv.DictReader(f)
         fld = reader.fieldnames or []
         if not fld or fld[0] != "id":
@@ -11,6 +11,10 @@ from typing import List, Optional
 from datetime import datetime, date
 import re
 from caltskcts.constants import VALID_TASK_STATES
+from caltskcts.date_utils import parse_date, parse_datetime
+
+# Non-digit characters, stripped before counting a phone number's digits
+_NON_DIGIT_RE = re.compile(r"\D")
 
 # --- Contact schema ---
 
@@ -47,7 +51,7 @@ class ContactModel(BaseModel):
         if v is None:
             return v
         # Count digits only
-        digits = re.sub(r"\D", "", v)
+        digits = _NON_DIGIT_RE.sub("", v)
         if not (7 <= len(digits) <= 15):
             raise ValueError(f"{info.field_name} must have between 7 and 15 digits")
         return v
@@ -81,9 +85,9 @@ class EventModel(BaseModel):
     @field_validator("date", mode="before")
     @classmethod
     def parse_date_string(cls, v) -> datetime:
-         if isinstance(v, str):
+        if isinstance(v, str):
             try:
-                return datetime.strptime(v, "%m/%d/%Y %H:%M")
+                return parse_datetime(v)
             except ValueError:
                 raise ValueError("Invalid date format. Use MM/DD/YYYY HH:MM")
         if isinstance(v, datetime):
@@ -110,7 +114,7 @@ class TaskModel(BaseModel):
     def parse_due_date(cls, v) -> date:
         if isinstance(v, str):
             try:
-                return datetime.strptime(v, "%m/%d/%Y").date()
+                return parse_date(v)
             except ValueError:
                 raise ValueError("Invalid date format. Use MM/DD/YYYY")
         elif isinstance(v, date):
@@ -1,14 +1,24 @@
+import itertools
 import json
+import mmap
 import re
 import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Generic
 from datetime import date, datetime
 from filelock import FileLock, Timeout
+import orjson
 
-from sqlalchemy import create_engine, Date, DateTime
-from sqlalchemy.orm import declarative_base, sessionmaker, DeclarativeMeta
+from sqlalchemy import create_engine, event, Date, DateTime
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import declarative_base, sessionmaker, DeclarativeMeta, Session
+from sqlalchemy.pool import QueuePool, StaticPool
 
+from caltskcts.date_utils import parse_date, parse_datetime
 from caltskcts.logger import get_logger, log_exception
 
 # Base class for ORM models
@@ -17,6 +27,92 @@ Base = declarative_base()
 # Type variable for ORM model classes
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
+# Applied to every new SQLite connection opened by build_engine()
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Write buffer for state-file saves
+STATE_FILE_BUFFER = 64 * 1024
+
+# State files at least this large are memory-mapped for parsing instead of read()
+STATE_FILE_MMAP_MIN = 1024 * 1024
+
+def build_engine(state_uri: str) -> Engine:
+    """
+    Build a pooled Engine that several managers can share.
+
+    SQLite connections get the SQLITE_PRAGMAS tuning on connect. An in-memory
+    SQLite database is pinned to a single connection (StaticPool) so every
+    manager sees the same data.
+
+    Args:
+        state_uri: SQLAlchemy database URL
+
+    Returns:
+        The configured Engine
+    """
+    url = make_url(state_uri)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            state_uri, future=True, poolclass=QueuePool,
+            pool_size=5, max_overflow=10, pool_pre_ping=True,
+        )
+
+    if url.database in (None, "", ":memory:"):
+        engine = create_engine(
+            state_uri, future=True, poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        engine = create_engine(
+            state_uri, future=True, poolclass=QueuePool,
+            pool_size=5, max_overflow=10,
+        )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn: Any, _record: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+# Compiled search patterns kept by _compile_pattern()
+PATTERN_CACHE_SIZE = 256
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_pattern(pattern: str, flags: int) -> "re.Pattern[str]":
+    """
+    re.compile, memoized per (pattern, flags). Repeated searches skip re's
+    own cache bookkeeping and don't compete with other modules' patterns.
+    """
+    return re.compile(pattern, flags)
+
+# Characters that give a query regex meaning; queries without any are plain substrings
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Engines whose tables have already been created by ensure_schema()
+_schema_ready: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+def ensure_schema(engine: Engine) -> None:
+    """
+    Create all ORM tables on `engine`, once per engine. Managers sharing an
+    engine then skip the repeated create_all() round-trips at startup.
+
+    Args:
+        engine: Engine to create the tables on
+    """
+    if engine in _schema_ready:
+        return
+    Base.metadata.create_all(engine)
+    _schema_ready.add(engine)
+
 class StateManagerBase(ABC, Generic[ModelType]):
     """
     Base class for managing state via JSON files or SQLAlchemy ORM.
@@ -25,22 +121,43 @@ class StateManagerBase(ABC, Generic[ModelType]):
     """
     _state: Dict[int, Any] # unified in-memory cache of DB or JSON rows
     Model: Type[ModelType]
+    _version: int                   # bumped on every write to _state
+    _indexed_state: Optional[Dict[int, Any]]  # _state object the derived lookups were built from
+    _indexed_version: int                     # _version the derived lookups were built from
+    _index_lock: threading.RLock              # serializes rebuilds and per-item patches of the lookups
 
-    def __init__(self, state_uri: str):
+    def __init__(
+        self,
+        state_uri: str,
+        engine: Optional[Engine] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
         """
         If state_uri contains '://', we treat it as a database URL.
         Otherwise we treat it as a path to a JSON file.
+
+        An existing `engine` (see build_engine) may be passed in so several
+        managers share one connection pool instead of each creating its own,
+        and likewise a `session_factory` (e.g. a scoped_session) so they share
+        one Session per thread.
         """
         self.logger = get_logger(self.__class__.__name__)
         self.state_uri = state_uri
+        self._version = 0
+        self._indexed_state = None
+        self._indexed_version = -1
+        self._index_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty: Set[int] = set()      # IDs written inside batch(), not yet on disk
+        self._deleted: Set[int] = set()    # IDs deleted inside batch(), not yet on disk
 
         if "://" in state_uri:
             # --- DB backend (ORM) ---
             self._use_db = True
-            self.engine = create_engine(state_uri, future=True)
-            self.SessionLocal = sessionmaker(bind=self.engine, future=True)
-            # create tables
-            Base.metadata.create_all(self.engine)
+            self.engine = engine if engine is not None else create_engine(state_uri, future=True)
+            self.SessionLocal = session_factory or sessionmaker(bind=self.engine, future=True)
+            # create tables (skipped if this engine was already set up)
+            ensure_schema(self.engine)
             # load existing data
             self._state = self._load_state_db()
         else:
@@ -50,6 +167,9 @@ class StateManagerBase(ABC, Generic[ModelType]):
             self.state_file = state_uri
             self._state = self._load_state_file()
 
+        self._id_lock = threading.Lock()
+        self._id_counter = itertools.count(max(self._state, default=0) + 1)
+
     def _load_state(self) -> Dict[int, Any]:
         """ Alias for the old file-based loader, or DB loader if using SQL. """
         return self._load_state_db() if self._use_db else self._load_state_file()
@@ -77,6 +197,21 @@ class StateManagerBase(ABC, Generic[ModelType]):
             state = {}
         return state
 
+    def warm_statement_cache(self) -> None:
+        """
+        Run the primary-key lookup that update/delete issue once, against an
+        id that can't exist, so the engine's compiled-statement cache already
+        holds it when the first real request arrives. The full-table SELECT
+        is warmed by _load_state_db itself. No-op for the JSON-file backend.
+        """
+        if not self._use_db:
+            return
+        try:
+            with self.SessionLocal() as session:
+                session.get(self.Model, -1)
+        except Exception as e:
+            log_exception(e, f"Failed to warm statement cache for '{self.Model.__tablename__}'") # type: ignore
+
     # =========================
     # File-related save/load
     # =========================
@@ -92,6 +227,35 @@ class StateManagerBase(ABC, Generic[ModelType]):
             return obj.strftime("%m/%d/%Y")
         raise TypeError(f"Type {type(obj)} not serializable")
 
+    def _read_state_json(self) -> Dict[str, Any]:
+        """
+        Read and decode the whole state file with orjson. Large files are
+        memory-mapped and parsed in place, which skips copying them into a
+        bytes object first. FileNotFoundError and json.JSONDecodeError
+        (orjson's error subclasses it) propagate.
+        """
+        with open(self.state_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < STATE_FILE_MMAP_MIN:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _write_state_json(self, data: Dict[str, Any]) -> None:
+        """
+        Overwrite the state file with `data`. The JSON is encoded by orjson
+        and handed to a 64 KiB buffered file in one write. Dates/datetimes go
+        through _json_default so they keep the MM/DD/YYYY[ HH:MM] layout.
+        Caller must hold the file lock.
+        """
+        buf = orjson.dumps(
+            data,
+            default=self._json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        with open(self.state_file, "wb", buffering=STATE_FILE_BUFFER) as f:
+            f.write(buf)
+
     def _load_state_file(self) -> Dict[int, Any]:
         """
         Concurrency-safe load: acquire a filesystem lock, read the JSON (or
@@ -104,8 +268,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
             lock.acquire()
             acquired = True
             try:
-                with open(self.state_file, "r") as f:
-                    data = json.load(f)
+                data = self._read_state_json()
             except FileNotFoundError:
                 self.logger.warning(f"State file not found: {self.state_file}. Using empty state.")
                 data = {}
@@ -142,15 +305,14 @@ class StateManagerBase(ABC, Generic[ModelType]):
             lock.acquire()
             acquired = True
             try:
-                with open(self.state_file, "r") as f:
-                    existing = json.load(f)
+                existing = self._read_state_json()
             except (FileNotFoundError, json.JSONDecodeError):
                 existing = {}
             snapshot = {str(k): v for k, v in self._state.items()}
             existing.update(snapshot) # type: ignore
-            with open(self.state_file, "w") as f:
-                json.dump(existing, f, indent=4, default=self._json_default)
-            self._state = {int(k): v for k, v in existing.items()}  # type: ignore
+            self._write_state_json(existing)
+            self._adopt_file_state(existing)
+            self._version += 1
                 
         except Timeout:
             self.logger.error(f"Could not acquire lock for writing {self.state_file}")
@@ -171,28 +333,48 @@ class StateManagerBase(ABC, Generic[ModelType]):
         
     def _save_one_file(self, item_id: int, item_data: Any) -> None:
         """Insert or update a single record in the JSON file, under lock."""
+        if self._batch_depth:
+            self._dirty.add(item_id)
+            self._deleted.discard(item_id)
+            return
+        self._apply_file_changes({item_id: item_data}, ())
+
+    def _delete_one_file(self, item_id: int) -> None:
+        """Delete a single record from the JSON file, under lock."""
+        if self._batch_depth:
+            self._dirty.discard(item_id)
+            self._deleted.add(item_id)
+            return
+        self._apply_file_changes({}, (item_id,))
+
+    def _apply_file_changes(self, upserts: Dict[int, Any], deletes: Iterable[int]) -> None:
+        """
+        Under the file lock, re-read the JSON file, apply the given inserts/
+        updates and deletes, write it back once, and adopt the merged result
+        (which includes anything other writers saved) into _state.
+        """
         lock = FileLock(self.state_file + ".lock", timeout=2)
         acquired = False
         try:
             lock.acquire()
             acquired = True
             try:
-                with open(self.state_file, "r") as f:
-                    data = json.load(f)
+                data = self._read_state_json()
             except (FileNotFoundError, json.JSONDecodeError):
                 data = {}
 
-            data[str(item_id)] = item_data
-            with open(self.state_file, "w") as f:
-                json.dump(data, f, indent=4, default=self._json_default)
-        
-            self._state = {int(k): v for k, v in data.items()} # type: ignore
+            for item_id in deletes:
+                data.pop(str(item_id), None) # type: ignore
+            for item_id, item_data in upserts.items():
+                data[str(item_id)] = item_data
+            self._write_state_json(data)
+            self._adopt_file_state(data)
 
         except Timeout:
             self.logger.error(f"Could not acquire lock for writing {self.state_file}")
             raise
         except Exception as e:
-            log_exception(e, f"Failed to save one record to {self.state_file}")
+            log_exception(e, f"Failed to write changes to {self.state_file}")
             raise
         finally:
             if acquired:
@@ -204,56 +386,145 @@ class StateManagerBase(ABC, Generic[ModelType]):
                     os.remove(lock.lock_file)
                 except (OSError, FileNotFoundError):
                     pass
-    
-    def _delete_one_file(self, item_id: int) -> None:
-        """Delete a single record from the JSON file, under lock."""
-        lock = FileLock(self.state_file + ".lock", timeout=2)
-        acquired = False
-        try:
-            lock.acquire()
-            acquired = True
-            try:
-                with open(self.state_file, "r") as f:
-                    data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                data = {}
 
-            data.pop(str(item_id), None) # type: ignore
-            with open(self.state_file, "w") as f:
-                json.dump(data, f, indent=4, default=self._json_default)
+    def _adopt_file_state(self, data: Dict[str, Any]) -> None:
+        """
+        Bring _state in line with `data`, the decoded state file, in place.
+        Keeping the same dict lets the derived lookups be patched per item
+        instead of rebuilt after every save: items another writer added,
+        changed or removed are patched here, and the caller's own write is
+        patched by its _note_write.
+        """
+        merged = {int(k): v for k, v in data.items()}
+        with self._index_lock:
+            synced = self._index_in_sync()
+            changed = [item_id for item_id in self._state if item_id not in merged]
+            for item_id in changed:
+                del self._state[item_id]
+            for item_id, item in merged.items():
+                if item_id not in self._state or self._state[item_id] != item:
+                    self._state[item_id] = item
+                    changed.append(item_id)
+            if not changed:
+                return
+            self._version += 1
+            if synced:
+                for item_id in changed:
+                    self._unindex_item(item_id)
+                    if item_id in self._state:
+                        self._index_item(item_id)
+                self._indexed_version = self._version
 
-            self._state = {int(k): v for k, v in data.items()} # type: ignore
+    @contextmanager
+    def batch(self) -> Iterator["StateManagerBase[ModelType]"]:
+        """
+        Group several add/update/delete calls into a single state-file
+        rewrite. Inside the block, writes only update the in-memory state;
+        the file is rewritten once on exit (even if the block raises).
+        Blocks may be nested; the outermost one flushes. Has no effect on
+        the DB backend, which commits per record.
 
-        except Timeout:
-            self.logger.error(f"Could not acquire lock for writing {self.state_file}")
-            raise
-        except Exception as e:
-            log_exception(e, f"Failed to delete one record from {self.state_file}")
-            raise
+        Returns:
+            This manager, for use as `with mgr.batch() as m:`
+        """
+        self._batch_depth += 1
+        try:
+            yield self
         finally:
-            if acquired:
-                try:
-                    lock.release()
-                except Exception:
-                    pass
-                try:
-                    os.remove(lock.lock_file)
-                except (OSError, FileNotFoundError):
-                    pass
-        
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any changes buffered by batch() to the state file."""
+        if self._use_db or not (self._dirty or self._deleted):
+            return
+        upserts = {i: self._state[i] for i in self._dirty if i in self._state}
+        deletes = tuple(self._deleted)
+        self._dirty.clear()
+        self._deleted.clear()
+        self._apply_file_changes(upserts, deletes)
+
+    # ----------------------
+    # Derived lookups
+    # ----------------------
+    def _reindex(self) -> None:
+        """
+        Rebuild the subclass's lookups derived from _state. The base keeps none.
+        Implementations build the new lookups in locals and assign them once
+        complete, so readers never see a half-built index.
+        """
+
+    def _index_item(self, item_id: int) -> None:
+        """Add one item of _state to the subclass's lookups."""
+
+    def _unindex_item(self, item_id: int) -> None:
+        """Drop one item from the subclass's lookups; unknown IDs are ignored."""
+
+    def _index_in_sync(self) -> bool:
+        """True if the derived lookups currently match _state."""
+        return self._indexed_state is self._state and self._indexed_version == self._version
+
+    def _sync_index(self) -> None:
+        """
+        Make sure the derived lookups match _state, rebuilding them if _state
+        was replaced (e.g. re-read from the state file) or changed without
+        going through the per-item hooks. Call before reading the lookups.
+        Rebuilds run under _index_lock, so concurrent callers build once.
+        """
+        if self._index_in_sync():
+            return
+        with self._index_lock:
+            if self._index_in_sync():
+                return
+            # record what the rebuild starts from; a write landing mid-rebuild
+            # bumps _version past this and triggers another rebuild later
+            state, version = self._state, self._version
+            self._reindex()
+            self._indexed_state = state
+            self._indexed_version = version
+
+    def _note_write(self, item_id: int, was_synced: bool) -> None:
+        """
+        Bump the data version after a write to `item_id`, and patch the
+        derived lookups for that one item if they were current beforehand
+        and _state is still the same object (otherwise they rebuild lazily).
+        """
+        with self._index_lock:
+            # still current only if no other write slipped past the lookups
+            # since this one checked
+            patch = was_synced and self._index_in_sync()
+            self._version += 1
+            if patch:
+                self._unindex_item(item_id)
+                if item_id in self._state:
+                    self._index_item(item_id)
+                self._indexed_version = self._version
+
+    def _row(self, item_id: int) -> Dict[str, Any]:
+        """Return one item of _state as a plain dict (flattening ORM rows)."""
+        obj = self._state[item_id]
+        return self._flatten(obj) if self._use_db else obj
+
     # ----------------------
     # Shared CRUD entry points
     # ----------------------
     def _get_next_id(self) -> int:
         """
         Get the next available ID for an item in the state.
+
+        IDs come from a counter seeded once from the highest ID at load time,
+        skipping any that have since been taken (explicit IDs, or rows merged
+        in from the state file by another writer).
         
         Returns:
             Next available integer ID
         """
-        if not self._state:
-            return 1
-        return max(int(k) for k in self._state) + 1
+        with self._id_lock:
+            item_id = next(self._id_counter)
+            while item_id in self._state:
+                item_id = next(self._id_counter)
+            return item_id
 
     def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -286,6 +557,36 @@ class StateManagerBase(ABC, Generic[ModelType]):
         # JSON-file mode: obj is already a dict
         return obj
 
+    @staticmethod
+    def _flatten(obj: Any) -> Dict[str, Any]:
+        """Convert an ORM instance into a plain dict with MM/DD/YYYY[ HH:MM] dates."""
+        flat: Dict[str, Any] = {}
+        for col in obj.__table__.columns:   # type: ignore[attr-defined]
+            v = getattr(obj, col.name)      # type: ignore[attr-defined]
+            if isinstance(v, datetime):
+                flat[col.name] = v.strftime("%m/%d/%Y %H:%M")
+            elif isinstance(v, date):
+                flat[col.name] = v.strftime("%m/%d/%Y")
+            else:
+                flat[col.name] = v
+        return flat
+
+    def iter_items(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (item_id, item) pairs one at a time, flattening ORM rows lazily
+        so callers can stream the listing without building it all up front.
+        
+        Returns:
+            Iterator over (integer ID, item data) pairs
+        """
+        # snapshot the keys/values so concurrent writes can't break iteration
+        snapshot = list(self._state.items())
+        if getattr(self, "_use_db", False):
+            for item_id, obj in snapshot:
+                yield item_id, self._flatten(obj)
+        else:
+            yield from snapshot
+
     def list_items(self) -> Dict[int, Any]:
         """
         List all items with integer keys.
@@ -296,23 +597,26 @@ class StateManagerBase(ABC, Generic[ModelType]):
         self.logger.debug(f"Listing {len(self._state)} items")
         if getattr(self, "_use_db", False):
             # DB mode: convert each ORM instance into a plain dict
-            result: Dict[int, Any] = {}
-            for item_id, obj in self._state.items():
-                flat = {}
-                for col in obj.__table__.columns:   # type: ignore[attr-defined]
-                    v = getattr(obj, col.name)      # type: ignore[attr-defined]
-                    if isinstance(v, datetime):
-                        flat[col.name] = v.strftime("%m/%d/%Y %H:%M")
-                    elif isinstance(v, date):
-                        flat[col.name] = v.strftime("%m/%d/%Y")
-                    else:
-                        flat[col.name] = v
-                result[item_id] = flat
-            return result
+            return dict(self.iter_items())
         
         # File-based mode, just return the in-memory dict
         return dict(self._state)
 
+    def list_items_compact(self) -> Dict[str, List[Any]]:
+        """
+        List all items column-wise: the field names once, then one value
+        list per item in that order, instead of repeating every key per row.
+        
+        Returns:
+            {"columns": [field names], "rows": [[values], ...]}
+        """
+        columns = [col.name for col in self.Model.__table__.columns]  # type: ignore[attr-defined]
+        rows = [
+            [item_id if name == "id" else row.get(name) for name in columns]
+            for item_id, row in self.iter_items()
+        ]
+        return {"columns": columns, "rows": rows}
+
     def add_item(self, item_id: int, item_data: Dict[str, Any]) -> bool:
         """
         Add an item to state with the specified ID.
@@ -329,6 +633,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
             return False
 
         self._validate_item(item_data)
+        synced = self._index_in_sync()
         if self._use_db:
             kwargs = dict(item_data)
             for col in self.Model.__table__.columns:     # type: ignore[attr-defined]
@@ -336,9 +641,9 @@ class StateManagerBase(ABC, Generic[ModelType]):
                 if name in kwargs and isinstance(kwargs[name], str):
                     val = kwargs[name]
                     if isinstance(col.type, Date): # type: ignore[attr-defined]
-                        kwargs[name] = datetime.strptime(val, "%m/%d/%Y").date()
+                        kwargs[name] = parse_date(val)
                     elif isinstance(col.type, DateTime): # type: ignore[attr-defined]
-                        kwargs[name] = datetime.strptime(val, "%m/%d/%Y %H:%M")
+                        kwargs[name] = parse_datetime(val)
 
             try:
                 inst = self.Model(id=item_id, **kwargs) # type: ignore
@@ -347,6 +652,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
                     session.commit()
                     session.refresh(inst)
                 self._state[item_id] = inst
+                self._note_write(item_id, synced)
             except Exception as e:
                 log_exception(e, f"Failed to add item {item_id} to DB")
                 return False
@@ -358,6 +664,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
                 elif isinstance(v, date):
                     self._state[item_id][k] = v.strftime("%m/%d/%Y")
             self._save_one_file(item_id, self._state[item_id])
+            self._note_write(item_id, synced)
         self.logger.info(f"Added item with ID {item_id}")
         return True
 
@@ -374,6 +681,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
         """
         if item_id not in self._state:
             return False
+        synced = self._index_in_sync()
         if self._use_db:
             try:
                 with self.SessionLocal() as session:
@@ -385,9 +693,9 @@ class StateManagerBase(ABC, Generic[ModelType]):
                         if isinstance(v, str):
                             col = self.Model.__table__.columns[k] # type: ignore[attr-defined]
                             if isinstance(col.type, Date): # type: ignore[attr-defined]
-                                v = datetime.strptime(v, "%m/%d/%Y").date()
+                                v = parse_date(v)
                             elif isinstance(col.type, DateTime):  # type: ignore[attr-defined]
-                                v = datetime.strptime(v, "%m/%d/%Y %H:%M")
+                                v = parse_datetime(v)
                         setattr(inst, k, v)
 
                     # build a flat dict for validation, formatting dates/times
@@ -408,6 +716,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
                     session.commit()
                     session.refresh(inst)
                 self._state[item_id] = inst
+                self._note_write(item_id, synced)
                 return True
             except Exception as e:
                 log_exception(e, f"Failed to update item {item_id} in DB")
@@ -422,6 +731,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
                     merged[k] = v.strftime("%m/%d/%Y")
             self._state[item_id] = merged
             self._save_one_file(item_id, self._state[item_id])
+            self._note_write(item_id, synced)
             return True
 
     def delete_item(self, item_id: int) -> bool:
@@ -436,6 +746,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
         """
         if item_id not in self._state:
             return False
+        synced = self._index_in_sync()
         if self._use_db:
             try:
                 with self.SessionLocal() as session:
@@ -445,6 +756,7 @@ class StateManagerBase(ABC, Generic[ModelType]):
                     session.delete(inst)
                     session.commit()
                 del self._state[item_id]
+                self._note_write(item_id, synced)
                 return True
             except Exception as e:
                 log_exception(e, f"Failed to delete item {item_id} from DB")
@@ -452,8 +764,31 @@ class StateManagerBase(ABC, Generic[ModelType]):
         else:
             del self._state[item_id]
             self._delete_one_file(item_id)
+            self._note_write(item_id, synced)
             return True
 
+    def _compile_query(self, query: str, flags: int = re.IGNORECASE) -> "re.Pattern[str]":
+        """
+        Compile a user-supplied search pattern.
+        
+        Raises:
+            ValueError: If the pattern is not a valid regex
+        """
+        try:
+            return _compile_pattern(query, flags)
+        except re.error as e:
+            error_msg = f"Invalid regex pattern: {e}"
+            self.logger.error(error_msg)
+            raise ValueError(error_msg)
+
+    @staticmethod
+    def _is_literal_query(query: str) -> bool:
+        """
+        True if `query` has no regex metacharacters, so a case-insensitive
+        substring test finds exactly what _compile_query(query) would.
+        """
+        return _REGEX_META.isdisjoint(query)
+
     def search_items(self, query: str, fields: List[str]) -> List[Dict[str, Any]]:
         """
         Generic search function that searches across specified fields using regex.
@@ -466,20 +801,11 @@ class StateManagerBase(ABC, Generic[ModelType]):
             List of matching items with their IDs included
         """
         self.logger.debug(f"Searching for '{query}' in fields: {fields}")
-        try:
-            query_regex = re.compile(query, re.IGNORECASE)
-        except re.error as e:
-            error_msg = f"Invalid regex pattern: {e}"
-            self.logger.error(error_msg)
-            raise ValueError(error_msg)
+        query_regex = self._compile_query(query)
         
         results: List[Dict[str, Any]] = []
-        for item_id, item in self._state.items():
-            if self._use_db:
-                row = {col.name: getattr(item, col.name) for col in item.__table__.columns}
-                row["item_id"] = item_id
-            else:
-                row: Dict[str, Any] = {"item_id": item_id, **item}
+        for item_id in list(self._state):
+            row = self._search_row(item_id)
             for f in fields:
                 if f in row and row[f] and query_regex.search(str(row[f])):
                     results.append(row)
@@ -488,6 +814,26 @@ class StateManagerBase(ABC, Generic[ModelType]):
         self.logger.debug(f"Search found {len(results)} results")
         return results
 
+    def _search_row(self, item_id: int) -> Dict[str, Any]:
+        """One search result: the item's raw column values plus its "item_id"."""
+        item = self._state[item_id]
+        if self._use_db:
+            row = {col.name: getattr(item, col.name) for col in item.__table__.columns}
+            row["item_id"] = item_id
+            return row
+        return {"item_id": item_id, **item}
+
+    @property
+    def version(self) -> int:
+        """
+        Monotonic counter that changes whenever this manager writes its state.
+        Useful as a cache key for anything derived from the items.
+        
+        Returns:
+            Current data version
+        """
+        return self._version
+
     @property
     def items(self) -> Dict[int, Any]:
         """
@@ -1,11 +1,19 @@
-from typing import Dict, List, Optional, Any, MutableMapping
-from datetime import datetime, date
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Any, MutableMapping, Set, Tuple
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from sqlalchemy import Integer, Float, String, Date
 from sqlalchemy.orm import Mapped, mapped_column
 from pydantic import ValidationError
+from caltskcts.date_utils import parse_date
 from caltskcts.state_manager import Base, StateManagerBase
 from caltskcts.schemas import TaskModel
 
+@lru_cache(maxsize=4096)
+def _parse_due(value: str) -> date:
+    """Parse an "MM/DD/YYYY" due date; repeated strings hit the cache."""
+    return parse_date(value)
+
 class TaskData(Base):
     __tablename__ = "tasks"
 
@@ -20,6 +28,12 @@ class Tasks(StateManagerBase[TaskData]):
     """Manages tasks and their due dates, status, and completion progress."""
     
     Model = TaskData
+    _open_due: Dict[int, date]             # task ID -> parsed due date, for tasks with one that aren't Completed
+    _open_by_due: List[Tuple[date, int]]   # the same entries as (due date, ID), kept sorted
+    _by_state: Dict[str, Set[int]]         # state value -> IDs of tasks in that state
+    _state_of: Dict[int, str]              # task ID -> its _by_state key
+    _progress_of: Dict[int, float]         # task ID -> progress
+    _by_progress: List[Tuple[float, int]]  # the same entries as (progress, ID), kept sorted
     
     def _validate_item(self, item: MutableMapping[str, Any]) -> bool:
         """
@@ -45,6 +59,85 @@ class Tasks(StateManagerBase[TaskData]):
         item.update(normalized)
         return True
 
+    def _reindex(self) -> None:
+        open_due: Dict[int, date] = {}
+        open_by_due: List[Tuple[date, int]] = []
+        by_state: Dict[str, Set[int]] = {}
+        state_of: Dict[int, str] = {}
+        progress_of: Dict[int, float] = {}
+        by_progress: List[Tuple[float, int]] = []
+        for task_id, task in list(self._state.items()):
+            due, state, progress = self._task_keys(task)
+            if progress is not None:
+                progress_of[task_id] = progress
+                by_progress.append((progress, task_id))
+            if state:
+                by_state.setdefault(state, set()).add(task_id)
+                state_of[task_id] = state
+            if due is not None:
+                open_due[task_id] = due
+                open_by_due.append((due, task_id))
+        # one sort per list for a full rebuild; insort is for single-item patches
+        open_by_due.sort()
+        by_progress.sort()
+        self._open_due, self._open_by_due = open_due, open_by_due
+        self._by_state, self._state_of = by_state, state_of
+        self._progress_of, self._by_progress = progress_of, by_progress
+
+    def _task_keys(self, task: Any) -> Tuple[Optional[date], Optional[str], Optional[float]]:
+        """
+        A task's indexed values: its parsed due date (None if it has none or
+        is Completed), its state, and its progress as a float (or None).
+        """
+        if self._use_db:
+            due, state, progress = task.dueDate, task.state, task.progress
+        else:
+            due, state, progress = task["dueDate"], task["state"], task.get("progress")
+        if progress is not None:
+            progress = float(progress)
+        if due and state != "Completed":
+            due = _parse_due(due) if isinstance(due, str) else due
+        else:
+            due = None
+        return due, state, progress
+
+    def _index_item(self, item_id: int) -> None:
+        due, state, progress = self._task_keys(self._state[item_id])
+        if progress is not None:
+            self._progress_of[item_id] = progress
+            insort(self._by_progress, (progress, item_id))
+        if state:
+            self._by_state.setdefault(state, set()).add(item_id)
+            self._state_of[item_id] = state
+        if due is not None:
+            self._open_due[item_id] = due
+            insort(self._open_by_due, (due, item_id))
+
+    def _unindex_item(self, item_id: int) -> None:
+        due = self._open_due.pop(item_id, None)
+        if due is not None:
+            del self._open_by_due[bisect_left(self._open_by_due, (due, item_id))]
+        state = self._state_of.pop(item_id, None)
+        if state is not None:
+            bucket = self._by_state[state]
+            bucket.discard(item_id)
+            if not bucket:
+                del self._by_state[state]
+        progress = self._progress_of.pop(item_id, None)
+        if progress is not None:
+            del self._by_progress[bisect_left(self._by_progress, (progress, item_id))]
+
+    def _open_tasks_due(self, first: Optional[date], last: date) -> List[Dict[str, Any]]:
+        """
+        Tasks that aren't Completed and are due between `first` (or any time,
+        if None) and `last` inclusive, in ID order, each with its "task_id".
+        """
+        self._sync_index()
+        lo = 0 if first is None else bisect_left(self._open_by_due, (first,))
+        hi = bisect_left(self._open_by_due, (last + timedelta(days=1),))
+        task_ids = sorted(task_id for _, task_id in self._open_by_due[lo:hi])
+        return [{"task_id": int(task_id), **self._row(task_id)} for task_id in task_ids]
+
     def add_task(
         self,
         title: str = "",
@@ -166,20 +259,9 @@ class Tasks(StateManagerBase[TaskData]):
             List of tasks
         """
         if not today:
-            today = datetime.now().strftime("%m/%d/%Y")
+            return self._open_tasks_due(None, datetime.now().date())
             
-        today_date = datetime.strptime(today, "%m/%d/%Y")
-        
-        results: List[Any] = []
-        for task_id, task in self.items.items():
-            if not task["dueDate"] or task["state"] == "Completed":
-                continue
-                
-            task_date = datetime.strptime(task["dueDate"], "%m/%d/%Y")
-            if task_date.date() <= today_date.date():
-                results.append({"task_id": int(task_id), **task})
-                
-        return results
+        return self._open_tasks_due(None, parse_date(today))
 
     def get_tasks_due_on(self, date: str) -> List[Dict[str, Any]]:
         """
@@ -191,18 +273,8 @@ class Tasks(StateManagerBase[TaskData]):
         Returns:
             List of tasks
         """
-        target_date = datetime.strptime(date, "%m/%d/%Y")
-        
-        results: List[Any] = []
-        for task_id, task in self.items.items():
-            if not task["dueDate"] or task["state"] == "Completed":
-                continue
-                
-            task_date = datetime.strptime(task["dueDate"], "%m/%d/%Y")
-            if task_date.date() == target_date.date():
-                results.append({"task_id": int(task_id), **task})
-                
-        return results
+        target_date = parse_date(date)
+        return self._open_tasks_due(target_date, target_date)
 
     def get_tasks_due_on_or_before(self, date: str) -> List[Dict[str, Any]]:
         """
@@ -214,18 +286,7 @@ class Tasks(StateManagerBase[TaskData]):
         Returns:
             List of tasks
         """
-        target_date = datetime.strptime(date, "%m/%d/%Y")
-        
-        results: List[Any] = []
-        for task_id, task in self.items.items():
-            if not task["dueDate"] or task["state"] == "Completed":
-                continue
-                
-            task_date = datetime.strptime(task["dueDate"], "%m/%d/%Y")
-            if task_date.date() <= target_date.date():
-                results.append({"task_id": int(task_id), **task})
-                
-        return results
+        return self._open_tasks_due(None, parse_date(date))
 
     def get_tasks_with_progress(
         self,
@@ -242,13 +303,11 @@ class Tasks(StateManagerBase[TaskData]):
         Returns:
             List of tasks within the progress range
         """
-        results: List[Any] = []
-        for task_id, task in self.items.items():
-            progress = task["progress"]
-            if min_progress <= progress <= max_progress:
-                results.append({"task_id": int(task_id), **task})
-                
-        return results
+        self._sync_index()
+        lo = bisect_left(self._by_progress, (min_progress,))
+        hi = bisect_right(self._by_progress, (max_progress, float("inf")))
+        task_ids = sorted(task_id for _, task_id in self._by_progress[lo:hi])
+        return [{"task_id": int(task_id), **self._row(task_id)} for task_id in task_ids]
 
     def get_tasks_by_state(self, state: str = "Not Started") -> List[Dict[str, Any]]:
         """
@@ -260,7 +319,18 @@ class Tasks(StateManagerBase[TaskData]):
         Returns:
             List of matching tasks
         """
-        return self.search_items(state, ["state"])
+        # tasks share a handful of state values, so match the query once
+        # per distinct value rather than once per task; plain strings such as
+        # "Completed" are a substring test and skip the regex engine entirely
+        pattern = None if self._is_literal_query(state) else self._compile_query(state)
+        needle = state.lower()
+        self._sync_index()
+        matched: List[int] = []
+        for value, task_ids in list(self._by_state.items()):
+            text = str(value)
+            if pattern.search(text) if pattern else needle in text.lower():
+                matched.extend(task_ids)
+        return [self._search_row(task_id) for task_id in sorted(matched)]
     
     def list_tasks(self) -> Dict[int, Any]:
         """
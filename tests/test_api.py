@@ -7,7 +7,7 @@ def app(tmp_path, monkeypatch):
     # each test gets its own SQLite file
     dbfile = tmp_path / "test.db"
     uri    = f"sqlite:///{dbfile}"
-    monkeypatch.setenv("STATE_URI", uri)
+    monkeypatch.setenv("DATABASE_URI", uri)
 
     app = create_app()
     app.config.update(TESTING=True)
@@ -40,6 +40,7 @@ def test_contacts_crud(client):
     # update
     rv = client.put(f"/contacts/{cid}", json={"company":"QA Inc."})
     assert rv.status_code == 200
+    assert rv.get_json()["id"] == cid
     assert "updated" in rv.get_json()["message"].lower()
     rv = client.get(f"/contacts/{cid}")
     assert rv.get_json()["company"] == "QA Inc."
@@ -47,6 +48,7 @@ def test_contacts_crud(client):
     # delete
     rv = client.delete(f"/contacts/{cid}")
     assert rv.status_code == 200
+    assert rv.get_json()["id"] == cid
     assert "deleted" in rv.get_json()["message"].lower()
     rv = client.get(f"/contacts/{cid}")
     assert rv.status_code == 404
@@ -125,6 +127,7 @@ def test_tasks_crud(client):
     # delete
     rv = client.delete(f"/tasks/{tid}")
     assert rv.status_code == 200
+    assert rv.get_json()["id"] == tid
     rv = client.get(f"/tasks/{tid}")
     assert rv.status_code == 404
 
@@ -144,3 +147,87 @@ def test_invalid_payloads(client):
         "title":"X","description":"X","due_date":"06/20/2025","progress":50,"state":"BAD"
     })
     assert rv.status_code == 400
+
+def test_list_cache_refreshes_after_write(client):
+    # prime the cached listing
+    rv = client.get("/contacts")
+    assert rv.status_code == 200
+    before = rv.get_json()
+
+    rv = client.post("/contacts", json={"first_name":"Cache","last_name":"Buster"})
+    assert rv.status_code == 201
+    cid = rv.get_json()["id"]
+
+    # listing must reflect the write, not the previously cached bytes
+    rv = client.get("/contacts")
+    after = rv.get_json()
+    assert str(cid) in after
+    assert len(after) == len(before) + 1
+
+    client.delete(f"/contacts/{cid}")
+    assert str(cid) not in client.get("/contacts").get_json()
+
+def test_streamed_listing_spans_batches(client, monkeypatch):
+    import api
+    monkeypatch.setattr(api, "LIST_STREAM_BATCH", 2)
+    ids = []
+    for i in range(5):
+        rv = client.post("/tasks", json={"title": f"Streamed {i}"})
+        assert rv.status_code == 201
+        ids.append(rv.get_json()["id"])
+
+    # first listing is streamed in chunks, second comes from the cache
+    streamed = client.get("/tasks").get_json()
+    cached = client.get("/tasks").get_json()
+    assert streamed == cached
+    for tid in ids:
+        assert streamed[str(tid)]["title"].startswith("Streamed")
+
+    for tid in ids:
+        client.delete(f"/tasks/{tid}")
+
+def test_compact_listing(client):
+    rv = client.post("/contacts", json={"first_name": "Col", "last_name": "Umn"})
+    cid = rv.get_json()["id"]
+
+    data = client.get("/contacts?compact=1").get_json()
+    assert data["columns"][0] == "id"
+    rows = {row[0]: dict(zip(data["columns"], row)) for row in data["rows"]}
+    assert rows == {int(k): v for k, v in client.get("/contacts").get_json().items()}
+    assert rows[cid]["first_name"] == "Col"
+
+    client.delete(f"/contacts/{cid}")
+
+def test_malformed_json_body(client):
+    rv = client.post("/contacts", data=b"{not json", content_type="application/json")
+    assert rv.status_code == 400
+
+    rv = client.post("/tasks", data=b"[1, 2]", content_type="application/json")
+    assert rv.status_code == 400
+
+def test_static_file_settings(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URI", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("CALTSKCTS_STATIC_MAX_AGE", "600")
+    monkeypatch.setenv("CALTSKCTS_X_SENDFILE", "1")
+    app = create_app()
+    assert app.config["SEND_FILE_MAX_AGE_DEFAULT"] == 600
+    assert app.config["USE_X_SENDFILE"] is True
+
+def test_index_html_always_revalidates(tmp_path, monkeypatch):
+    static = tmp_path / "static"
+    static.mkdir()
+    (static / "index.html").write_text("shell")
+    (static / "app.js").write_text("js")
+    monkeypatch.setenv("DATABASE_URI", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("CALTSKCTS_STATIC_DIR", str(static))
+    client = create_app().test_client()
+
+    for path in ("/", "/index.html", "/some/client/route"):
+        rv = client.get(path)
+        assert rv.status_code == 200
+        assert rv.data == b"shell"
+        assert "max-age=0" in rv.headers["Cache-Control"]
+        rv.close()
+    rv = client.get("/app.js")
+    assert "max-age=86400" in rv.headers["Cache-Control"]
+    rv.close()
@@ -1,7 +1,9 @@
 import os
 import tempfile
+import threading
 from typing import Any, Dict, MutableMapping
 import unittest
+from unittest.mock import patch
 
 from caltskcts.calendars import Calendar
 
@@ -260,6 +262,27 @@ class TestCalendar(unittest.TestCase):
         empty_events = self.calendar.get_events_by_date("05/16/2023")
         self.assertEqual(len(empty_events), 0)
     
+    def test_get_events_by_date_after_writes(self):
+        """Test that the per-day lookup follows updates and deletes, and prefixes still match."""
+        self.calendar.get_events_by_date("05/15/2023")
+        self.calendar.update_event(1, date="05/20/2023 08:00")
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/15/2023")], [2])
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/20/2023")], [1, 3])
+        self.calendar.delete_event(3)
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/20/2023")], [1])
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/")], [1, 2])
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/15/2023 14")], [2])
+    
+    def test_event_without_duration(self):
+        """Test that an event with no duration is indexed as zero-length, not an error."""
+        self.calendar.add_event(title="Reminder", date="05/15/2023 09:30", duration=None)
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/15/2023")], [1, 2, 4])
+        self.assertIn(4, [e["event_id"] for e in self.calendar.get_events_between("05/15/2023", "05/15/2023")])
+        self.assertEqual(self.calendar.find_next_available("05/15/2023 10:00", 30), "05/15/2023 10:00")
+        
+        reloaded = Calendar(self.temp_file_path)
+        self.assertEqual(len(reloaded.get_events_by_date("05/15/2023")), 3)
+    
     def test_get_events_between(self):
         """Test retrieving events between two dates."""
         # Get events between 05/14/2023 and 05/16/2023
@@ -280,6 +303,55 @@ class TestCalendar(unittest.TestCase):
         empty_events = self.calendar.get_events_between("05/16/2023", "05/19/2023")
         self.assertEqual(len(empty_events), 0)
     
+    def test_get_events_between_after_writes(self):
+        """Test that the date filters see updates and deletes."""
+        self.calendar.get_events_between("05/14/2023", "05/16/2023")
+        self.calendar.update_event(2, date="05/18/2023 10:00")
+        self.calendar.delete_event(1)
+        self.assertEqual(self.calendar.get_events_between("05/14/2023", "05/16/2023"), [])
+        moved = self.calendar.get_events_between("05/18/2023", "05/18/2023")
+        self.assertEqual([e["event_id"] for e in moved], [2])
+        self.calendar.add_event(title="Earlier", date="05/20/2023 07:00", duration=15)
+        in_order = self.calendar.get_events_between("05/18/2023", "05/20/2023")
+        self.assertEqual([e["event_id"] for e in in_order], [2, 3, 4])  # ID order, not start order
+        self.assertEqual(self.calendar.find_next_available("05/18/2023 10:00", 30), "05/18/2023 10:30")
+
+    def test_concurrent_index_rebuild(self):
+        """Test that threads racing to build the date index build it once."""
+        with self.calendar.batch():
+            for i in range(5000):
+                self.calendar.add_event(title=f"Slot {i}", date=f"06/{i % 28 + 1:02d}/2023 {i % 24:02d}:00")
+        self.calendar._version += 1  # force the next query to rebuild
+        barrier = threading.Barrier(4)
+
+        def query():
+            barrier.wait()
+            self.calendar.get_events_between("06/01/2023", "06/28/2023")
+
+        threads = [threading.Thread(target=query) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(self.calendar._sorted_slots), 5003)
+        self.assertEqual(len(self.calendar.get_events_between("06/01/2023", "06/28/2023")), 5000)
+
+    def test_writes_patch_index_in_file_mode(self):
+        """Test that saves patch the date index instead of forcing a rebuild."""
+        self.calendar.get_events_by_date("05/15/2023")
+        other = Calendar(self.temp_file_path)
+        other.add_event(title="Lunch", date="05/15/2023 12:00", duration=60, event_id=10)
+        with patch.object(self.calendar, "_reindex", wraps=self.calendar._reindex) as reindex:
+            self.calendar.update_event(1, date="05/16/2023 09:00")
+            on_15th = self.calendar.get_events_by_date("05/15/2023")
+            self.calendar.delete_event(2)
+            after_delete = self.calendar.get_events_by_date("05/15/2023")
+        reindex.assert_not_called()
+        # the other manager's save is picked up along with this one's
+        self.assertEqual([e["event_id"] for e in on_15th], [2, 10])
+        self.assertEqual([e["event_id"] for e in after_delete], [10])
+        self.assertEqual([e["event_id"] for e in self.calendar.get_events_by_date("05/16/2023")], [1])
+
     def test_find_next_available(self):
         """Test finding the next available time slot."""
         # Find next available time of 30 minutes after 05/15/2023 08:00
@@ -372,6 +444,15 @@ class TestCalendar(unittest.TestCase):
         
         next_time = self.calendar.find_next_available("01/01/2023 09:30", 30)
         self.assertEqual(next_time, "01/01/2023 10:00")
+
+        # A long event that starts earlier and encloses later ones
+        self.calendar.add_event(title="Offsite", date="02/01/2023 08:00", duration=240)
+        self.calendar.add_event(title="Inside", date="02/01/2023 09:00", duration=30)
+        self.calendar.add_event(title="Right after", date="02/01/2023 12:00", duration=30)
+        next_time = self.calendar.find_next_available("02/01/2023 08:30", 45)
+        self.assertEqual(next_time, "02/01/2023 12:30")
+        next_time = self.calendar.find_next_available("02/01/2023 08:30", 0)
+        self.assertEqual(next_time, "02/01/2023 12:00")
         
         next_time = self.calendar.find_next_available("01/01/2023 10:00", 60)
         self.assertEqual(next_time, "01/01/2023 11:30")
@@ -38,6 +38,13 @@ def test_raw_cal_command(temp_json_files):
     assert result.exit_code == 0
     assert "Existing Meeting" in result.output
 
+def test_raw_output_is_indented_json(temp_json_files):
+    result = runner.invoke(cli_app, ["--file", "raw", "cal.list_events()"])
+    assert result.exit_code == 0
+    body = json.loads(result.output[result.output.index("{"):])
+    assert body["1"]["title"] == "Existing Meeting"
+    assert '\n  "1": {\n    "title"' in result.output
+
 def test_raw_task_command(temp_json_files):
     result = runner.invoke(cli_app, ["--file", "raw", "tsk.list_tasks()"])
     assert result.exit_code == 0
@@ -56,6 +63,18 @@ def test_add_event(temp_json_files):
     assert result.exit_code == 0
     assert "Test Event" in result.stdout
 
+def test_only_used_manager_is_loaded(temp_json_files, monkeypatch):
+    import caltskcts.cli as cli_mod
+    built = []
+    for name in ("Calendar", "Tasks", "Contacts"):
+        cls = getattr(cli_mod, name)
+        monkeypatch.setattr(cli_mod, name,
+                            lambda uri, cls=cls: built.append(cls.__name__) or cls(uri))
+    result = runner.invoke(cli_app, ["--file", "cal", "list_events"])
+    assert result.exit_code == 0
+    assert "Existing Meeting" in result.stdout
+    assert built == ["Calendar"]
+
 def test_add_contact(temp_json_files):
     result = runner.invoke(cli_app, ["--file", "ctc", "add_contact", "-f", "Joe", "-l", "Bob Briggs"])
     assert result.exit_code == 0
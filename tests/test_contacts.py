@@ -243,6 +243,29 @@ class TestContacts(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["first_name"], "Jane")
     
+    def test_search_contacts_matches_search_items(self):
+        """Test that both search paths agree with search_items and follow updates."""
+        self.contacts.update_contact(2, company="Acme Widgets")
+        for query in ("acme", "Widgets", "TECH", "smith", "-", "@", "nobody",
+                      "^j", "n$", "\\d{3}", "[SsR]", "th.*corp", "\\Ajohn", "(?=acme)", "smith\\s+jane"):
+            with self.subTest(query=query):
+                literal = {c["item_id"] for c in self.contacts.search_contacts(query)}
+                regex = {c["item_id"] for c in self.contacts.search_items(
+                    query, ["first_name", "last_name", "email", "company",
+                            "work_phone", "mobile_phone", "home_phone"])}
+                self.assertEqual(literal, regex)
+        self.contacts.delete_contact(2)
+        self.assertEqual(self.contacts.search_contacts("acme"), [])
+
+    def test_search_contacts_in_id_order(self):
+        """Test that search results stay in ID order after an update."""
+        self.contacts.search_contacts("example")
+        self.contacts.update_contact(1, company="Acme")
+        results = self.contacts.search_contacts("example")
+        self.assertEqual([c["item_id"] for c in results], [1, 2, 3])
+        results = self.contacts.search_contacts("ex.mple")
+        self.assertEqual([c["item_id"] for c in results], [1, 2, 3])
+    
     def test_list_contacts(self):
         """Test listing all contacts."""
         all_contacts = self.contacts.list_contacts()
@@ -481,5 +504,15 @@ class TestContacts(unittest.TestCase):
                 # This should work because None values are filtered out
                 self.contacts.update_contact(1, title=None, company=None)
 
+    def test_next_id_skips_taken_ids(self):
+        """Auto-assigned IDs step over explicit IDs and are not reused after delete."""
+        self.contacts.add_contact(first_name="Explicit", last_name="Id", contact_id=4)
+        result = self.contacts.add_contact(first_name="Auto", last_name="Id")
+        self.assertIn("Contact 5 added", result)
+
+        self.contacts.delete_contact(5)
+        result = self.contacts.add_contact(first_name="Next", last_name="Id")
+        self.assertIn("Contact 6 added", result)
+
 if __name__ == "__main__":
     unittest.main()
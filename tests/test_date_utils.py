@@ -0,0 +1,26 @@
+import unittest
+from datetime import date, datetime
+
+from caltskcts.date_utils import parse_date, parse_datetime
+
+class TestDateUtils(unittest.TestCase):
+    """Fast-path parsers must agree with strptime."""
+
+    def test_parse_datetime(self):
+        self.assertEqual(parse_datetime("05/15/2023 09:30"), datetime(2023, 5, 15, 9, 30))
+        # unpadded input still goes through strptime
+        self.assertEqual(parse_datetime("5/1/2023 9:05"), datetime(2023, 5, 1, 9, 5))
+        for bad in ("13/01/2023 09:00", "05/15/2023 25:00", "+5/15/2023 09:00", "2023-05-15 09:00", ""):
+            with self.subTest(value=bad), self.assertRaises(ValueError):
+                parse_datetime(bad)
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("02/29/2024"), date(2024, 2, 29))
+        self.assertEqual(parse_date("2/9/2024"), date(2024, 2, 9))
+        for bad in ("02/30/2023", "02-28-2023", " 2/28/2023", "ab/cd/efgh"):
+            with self.subTest(value=bad), self.assertRaises(ValueError):
+                parse_date(bad)
+
+
+if __name__ == "__main__":
+    unittest.main()
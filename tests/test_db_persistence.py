@@ -3,10 +3,12 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from caltskcts.contacts import Contacts
 from caltskcts.calendars import Calendar
 from caltskcts.tasks    import Tasks
+from caltskcts.state_manager import build_engine, ensure_schema
 
 class TestDBPersistence(unittest.TestCase):
     """Verify that data written to the DB by one manager instance
@@ -75,6 +77,55 @@ class TestDBPersistence(unittest.TestCase):
         t2 = Tasks(self.db_uri)
         self.assertEqual(t2.list_tasks(), exp)
 
+    def test_shared_engine(self):
+        engine = build_engine(self.db_uri)
+        c = Contacts(self.db_uri, engine=engine)
+        t = Tasks(self.db_uri, engine=engine)
+        self.assertIs(c.engine, t.engine)
+
+        # SQLite connections are tuned on connect
+        with engine.connect() as conn:
+            mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        self.assertEqual(mode.lower(), "wal")
+
+        c.add_contact(first_name="Carol", last_name="C", contact_id=3)
+        self.assertEqual(Contacts(self.db_uri).get_contact(3)["first_name"], "Carol")
+        engine.dispose()
+
+    def test_ensure_schema_once_per_engine(self):
+        engine = build_engine(self.db_uri)
+        ensure_schema(engine)
+        with patch("caltskcts.state_manager.Base.metadata.create_all") as create_all:
+            Contacts(self.db_uri, engine=engine)
+            Calendar(self.db_uri, engine=engine)
+            ensure_schema(engine)
+        create_all.assert_not_called()
+        engine.dispose()
+
+    def test_date_filters_track_writes(self):
+        cal = Calendar(self.db_uri)
+        cal.add_event(title="Standup", date="03/01/2024 09:00", duration=15, event_id=1)
+        self.assertEqual(len(cal.get_events_between("03/01/2024", "03/01/2024")), 1)
+        cal.update_event(1, date="03/02/2024 09:00")
+        self.assertEqual(cal.get_events_between("03/01/2024", "03/01/2024"), [])
+        self.assertEqual(cal.find_next_available("03/02/2024 09:00", 30), "03/02/2024 09:15")
+
+        t = Tasks(self.db_uri)
+        t.add_task(title="File report", due_date="03/01/2024", task_id=1)
+        self.assertEqual([x["task_id"] for x in t.get_tasks_due_on("03/01/2024")], [1])
+        t.update_task(1, state="Completed")
+        self.assertEqual(t.get_tasks_due_on("03/01/2024"), [])
+        t.delete_task(1)
+        self.assertEqual(t.get_tasks_due_on_or_before("12/31/2024"), [])
+
+    def test_warm_statement_cache(self):
+        c = Contacts(self.db_uri)
+        c.add_contact(first_name="Dave", last_name="D", contact_id=4)
+        version = c.version
+        c.warm_statement_cache()
+        self.assertEqual(c.version, version)
+        self.assertEqual(list(c.list_items()), [4])
+
 
 if __name__ == "__main__":
     unittest.main()
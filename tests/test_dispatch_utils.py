@@ -0,0 +1,42 @@
+import pytest
+
+from caltskcts.dispatch_utils import dispatch_command
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+    def add(self, title, users=None):
+        self.calls.append((title, users))
+        return users
+    def _private(self):
+        self.calls.append("private")
+    not_callable = 5
+
+@pytest.fixture
+def context():
+    return {"rec": Recorder()}
+
+def test_dispatch_literal_args(context):
+    assert dispatch_command("rec.add('a', users=['x', 'y'])", context) == ["x", "y"]
+    assert context["rec"].calls == [("a", ["x", "y"])]
+
+def test_dispatch_gives_fresh_arguments(context):
+    first = dispatch_command("rec.add('a', users=[])", context)
+    first.append("mutated")
+    assert dispatch_command("rec.add('a', users=[])", context) == []
+
+@pytest.mark.parametrize("command, message", [
+    ("other.add('a')", "Must use one of"),
+    ("rec.missing()", "Unknown method"),
+    ("rec.__init__()", "Unknown method"),
+    ("rec._private()", "Unknown method"),
+    ("rec.not_callable()", "is not callable"),
+    ("rec.add(", "Invalid command format"),
+    ("rec.add", "Invalid command format"),
+    ("rec.add(__import__('os'))", "arguments must be literals"),
+    ("rec.add(**{'title': 'a'})", "not supported"),
+])
+def test_dispatch_rejects(context, command, message):
+    with pytest.raises(ValueError, match=message):
+        dispatch_command(command, context)
+    assert context["rec"].calls == []
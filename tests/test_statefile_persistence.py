@@ -6,7 +6,7 @@ from io import StringIO
 from typing import Any, Dict
 from unittest.mock import mock_open, patch
 
-from caltskcts.state_manager import StateManagerBase
+from caltskcts.state_manager import STATE_FILE_MMAP_MIN, StateManagerBase
 
 # Minimal concrete subclass just so we can instantiate the abstract base
 class DummyFileManager(StateManagerBase[Any]):
@@ -83,5 +83,36 @@ class TestStateFileBackend(unittest.TestCase):
             with self.assertRaises(IOError):
                 self.mgr._save_state_file()
 
+    def test_batch_writes_file_once(self):
+        """Writes inside batch() reach the file in one rewrite on exit."""
+        self.mgr.add_item(1, {"a": 1})
+        with patch.object(self.mgr, "_apply_file_changes",
+                          wraps=self.mgr._apply_file_changes) as apply:
+            with self.mgr.batch():
+                self.mgr.add_item(2, {"b": 2})
+                self.mgr.update_item(1, {"a": 10})
+                self.mgr.delete_item(2)
+                self.mgr.add_item(3, {"c": 3})
+                with self.mgr.batch():
+                    self.mgr.add_item(4, {"d": 4})
+                self.assertEqual(apply.call_count, 0)
+            self.assertEqual(apply.call_count, 1)
+
+        with open(self.path) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk, {"1": {"a": 10}, "3": {"c": 3}, "4": {"d": 4}})
+
+    def test_load_large_state_file(self):
+        """Files past STATE_FILE_MMAP_MIN load the same way through mmap."""
+        payload = {str(i): {"note": "x" * 100} for i in range(1, 12001)}
+        with open(self.path, "w") as f:
+            json.dump(payload, f)
+        self.assertGreaterEqual(os.path.getsize(self.path), STATE_FILE_MMAP_MIN)
+
+        data = self.mgr._load_state_file()
+        self.assertEqual(len(data), 12000)
+        self.assertEqual(data[12000], {"note": "x" * 100})
+
+
 if __name__ == "__main__":
     unittest.main()
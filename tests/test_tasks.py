@@ -342,6 +342,14 @@ class TestTasks(unittest.TestCase):
         self.assertIn(1, task_ids)
         self.assertNotIn(3, task_ids)
     
+    def test_due_filters_follow_state_changes(self):
+        """Test that completing or reopening a task updates the due-date filters."""
+        self.tasks.get_tasks_due_on_or_before("05/31/2023")
+        self.tasks.update_task(1, state="Completed")
+        self.tasks.update_task(3, state="In Progress", progress=20.0)
+        task_ids = [task["task_id"] for task in self.tasks.get_tasks_due_on_or_before("05/31/2023")]
+        self.assertEqual(task_ids, [2, 3])  # ID order
+    
     def test_get_tasks_with_progress(self):
         """Test getting tasks filtered by progress range."""
         # Get tasks with progress between 40 and 60
@@ -351,6 +359,15 @@ class TestTasks(unittest.TestCase):
         self.assertNotIn(1, task_ids)  # Has 0% progress
         self.assertNotIn(3, task_ids)  # Has 100% progress
     
+    def test_get_tasks_with_progress_after_updates(self):
+        """Test that the progress filter is inclusive and follows updates."""
+        self.tasks.get_tasks_with_progress()
+        self.tasks.update_task(1, progress=60.0)
+        self.tasks.delete_task(2)
+        task_ids = [task["task_id"] for task in self.tasks.get_tasks_with_progress(60.0, 100.0)]
+        self.assertEqual(task_ids, [1, 3])
+        self.assertEqual(self.tasks.get_tasks_with_progress(70.0, 60.0), [])
+    
     def test_get_tasks_by_state(self):
         """Test filtering tasks by state."""
         # Get all tasks with state "Not Started"
@@ -360,6 +377,17 @@ class TestTasks(unittest.TestCase):
         self.assertNotIn(2, task_ids)  # "In Progress"
         self.assertNotIn(3, task_ids)  # "Completed"
     
+    def test_get_tasks_by_state_matches_search_items(self):
+        """Test that per-state matching agrees with a full search, including after updates."""
+        self.tasks.update_task(1, state="In Progress")
+        for pattern in ("in progress", "STARTED", "^(Not|Comp)", "ed$", "xyz"):
+            with self.subTest(pattern=pattern):
+                by_state = [t["item_id"] for t in self.tasks.get_tasks_by_state(pattern)]
+                searched = [t["item_id"] for t in self.tasks.search_items(pattern, ["state"])]
+                self.assertEqual(by_state, sorted(searched))
+        with self.assertRaises(ValueError):
+            self.tasks.get_tasks_by_state("[")
+    
     def test_list_tasks(self):
         """Test listing all tasks."""
         all_tasks = self.tasks.list_tasks()